@@ -3,7 +3,9 @@ Configuration settings for the Scope Agent application.
 """
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from utils import serialization
 
 # Default settings
 DEFAULT_CONFIG = {
@@ -13,9 +15,20 @@ DEFAULT_CONFIG = {
     "auto_save": True
 }
 
+ENV_PREFIX = "SCOPE_AGENT_"
+
+# Parsed config files keyed by path, with the (mtime_ns, size) they were read at
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+def _prefixed_environ() -> Dict[str, str]:
+    """Collect the current SCOPE_AGENT_* environment variables in one pass."""
+    return {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIX)}
+
 class Config:
     """Manages application configuration settings."""
     
+    _instance: Optional["Config"] = None
+    
     def __init__(self, config_path: str = None):
         """Initialize configuration with default values and optional file loading."""
         self.settings: Dict[str, Any] = DEFAULT_CONFIG.copy()
@@ -27,33 +40,50 @@ class Config:
         # Override with environment variables
         self.load_from_env()
     
+    @classmethod
+    def instance(cls) -> "Config":
+        """Get the shared configuration, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
     def load_from_file(self, config_path: str) -> None:
-        """Load configuration from a file."""
+        """Load configuration from a file, reusing the parsed result if it is unchanged."""
         try:
-            import json
-            with open(config_path, 'r') as f:
-                file_config = json.load(f)
-                self.settings.update(file_config)
+            st = os.stat(config_path)
+            cached = _CONFIG_CACHE.get(config_path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self.settings.update(cached[2])
+                return
+            
+            with open(config_path, 'rb') as f:
+                file_config = serialization.loads(f.read())
+            _CONFIG_CACHE[config_path] = (st.st_mtime_ns, st.st_size, file_config)
+            self.settings.update(file_config)
         except Exception as e:
             print(f"Error loading configuration from {config_path}: {e}")
     
     def load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        env_prefix = "SCOPE_AGENT_"
+        env = _prefixed_environ()
+        if not env:
+            return
         
-        for key in self.settings.keys():
-            env_key = f"{env_prefix}{key.upper()}"
-            if env_key in os.environ:
-                # Convert types appropriately
-                if isinstance(self.settings[key], bool):
-                    self.settings[key] = os.environ[env_key].lower() in ('true', 'yes', '1')
-                elif isinstance(self.settings[key], int):
-                    try:
-                        self.settings[key] = int(os.environ[env_key])
-                    except ValueError:
-                        pass
-                else:
-                    self.settings[key] = os.environ[env_key]
+        for key, current in self.settings.items():
+            value = env.get(f"{ENV_PREFIX}{key.upper()}")
+            if value is None:
+                continue
+            
+            # Convert types appropriately
+            if isinstance(current, bool):
+                self.settings[key] = value.lower() in ('true', 'yes', '1')
+            elif isinstance(current, int):
+                try:
+                    self.settings[key] = int(value)
+                except ValueError:
+                    pass
+            else:
+                self.settings[key] = value
     
     def get(self, key: str, default=None) -> Any:
         """Get a configuration value with an optional default."""
@@ -66,9 +96,8 @@ class Config:
     def save(self, config_path: str) -> bool:
         """Save current configuration to a file."""
         try:
-            import json
-            with open(config_path, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            with open(config_path, 'wb') as f:
+                f.write(serialization.dumps(self.settings, indent=True))
             return True
         except Exception as e:
             print(f"Error saving configuration to {config_path}: {e}")
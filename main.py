@@ -5,17 +5,14 @@ Scope Agent - A CLI-based project scoping assistant powered by OpenAI.
 
 import os
 import sys
-import signal
 import logging
+from typing import Optional
 from openai import OpenAI
 
 from config import Config
 from managers.ui_manager import UIManager
 from managers.data_manager import DataManager
 from managers.project_manager import ProjectManager
-from managers.assistant_manager import AssistantManager
-from managers.conversation_manager import ConversationManager
-from managers.interaction_recorder import InteractionRecorder
 
 # Configure logging
 logging.basicConfig(
@@ -29,14 +26,34 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def signal_handler(sig, frame) -> None:
-    """Handle keyboard interrupts gracefully."""
-    logger.info("Keyboard interrupt detected")
-    print("\n\nKeyboard interrupt detected. Cleaning up...")
-    if 'project_manager' in globals() and project_manager is not None:
-        project_manager.cleanup()
-    print("Exiting...")
-    sys.exit(0)
+class App:
+    """Owns the application's managers."""
+    
+    def __init__(self, config: Config):
+        """Initialize the application."""
+        self.config = config
+        # Installs its own Ctrl+C handling once created
+        self.project_manager: Optional[ProjectManager] = None
+    
+    def run(self) -> None:
+        """Set up the managers and hand control to the project manager."""
+        # Set up API client
+        api_client = setup_api_client()
+        
+        # Set up core managers
+        ui_manager = UIManager()
+        data_manager = DataManager(projects_dir=self.config.get("projects_dir"))
+        
+        # Set up project manager (controller); it creates the conversation
+        # components itself once a project is opened
+        self.project_manager = ProjectManager(
+            api_client=api_client, 
+            ui_manager=ui_manager, 
+            data_manager=data_manager
+        )
+        
+        # Initialize and run the application
+        self.project_manager.initialize()
 
 def setup_api_client() -> OpenAI:
     """Set up and return the OpenAI API client."""
@@ -46,48 +63,18 @@ def setup_api_client() -> OpenAI:
         api_key = input("Please enter your OpenAI API key: ")
         os.environ["OPENAI_API_KEY"] = api_key
     
+    # The client pools its connections, so one client serves the session
     return OpenAI(api_key=api_key)
 
 def main() -> None:
     """Main function to run the Project Scoping Agent."""
     logger.info("Starting Scope Agent application")
     
-    # Set up signal handler for Ctrl+C
-    signal.signal(signal.SIGINT, signal_handler)
-    
     try:
         # Load configuration
-        config = Config()
+        config = Config.instance()
         
-        # Set up API client
-        api_client = setup_api_client()
-        
-        # Set up core managers
-        ui_manager = UIManager()
-        data_manager = DataManager(projects_dir=config.get("projects_dir"))
-        assistant_manager = AssistantManager(api_client)
-        interaction_recorder = InteractionRecorder()
-        
-        # Set up conversation manager
-        conversation_manager = ConversationManager(
-            assistant_manager=assistant_manager,
-            tool_manager=None,  # Will be set by ProjectManager
-            interaction_recorder=interaction_recorder
-        )
-        
-        # Set up project manager (controller)
-        global project_manager  # Make it global so signal handler can access it
-        project_manager = ProjectManager(
-            api_client=api_client, 
-            ui_manager=ui_manager, 
-            data_manager=data_manager,
-            assistant_manager=assistant_manager,
-            conversation_manager=conversation_manager,
-            interaction_recorder=interaction_recorder
-        )
-        
-        # Initialize and run the application
-        project_manager.initialize()
+        App(config).run()
         
     except Exception as e:
         logger.error(f"Unhandled exception in main: {e}", exc_info=True)
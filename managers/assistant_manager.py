@@ -1,8 +1,17 @@
 import time
-from typing import List, Dict, Any, Optional, Callable, Protocol
+import logging
+from typing import List, Dict, Any, Optional, Callable, Protocol, Set, Tuple
 
 from utils.progress import ProgressIndicator
 
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Polling backoff for run status checks (seconds)
+POLL_INITIAL_DELAY = 0.1
+POLL_MAX_DELAY = 1.0
+POLL_BACKOFF_FACTOR = 1.5
+
 class ApiClient(Protocol):
     """Protocol defining the required methods for the API client."""
     def beta(self) -> Any:
@@ -17,11 +26,23 @@ class AssistantManager:
         self.assistant = None
         self.thread_id = None
         self.progress = ProgressIndicator()
+        # True while the thread is known to have no run in flight, which lets
+        # cancel_active_runs skip its round-trip
+        self._no_active_runs = False
+        # Assistants and threads already confirmed to exist this session, so
+        # switching back to them skips the API round-trip
+        self._validated_assistants: Dict[str, Any] = {}
+        self._validated_threads: Set[str] = set()
         
         # Callbacks
         self.on_message_received: Optional[Callable[[str], None]] = None
         self.on_run_completed: Optional[Callable[[Any], None]] = None
     
+    @property
+    def run_may_be_active(self) -> bool:
+        """Whether the thread might still have a run in flight."""
+        return bool(self.thread_id) and not self._no_active_runs
+    
     def create_assistant(self, name: str, instructions: str, tools: List[Dict[str, Any]], model: str = "gpt-4o") -> str:
         """Create a new assistant and return its ID."""
         self.progress.start("Creating assistant")
@@ -34,15 +55,21 @@ class AssistantManager:
                 model=model
             )
             self.progress.stop()
-            print(f"Assistant created with ID: {self.assistant.id}")
+            self._validated_assistants[self.assistant.id] = self.assistant
+            logger.info(f"Assistant created with ID: {self.assistant.id}")
             return self.assistant.id
         except Exception as e:
             self.progress.stop()
-            print(f"Error creating assistant: {e}")
+            logger.error(f"Error creating assistant: {e}")
             return ""
     
     def get_assistant(self, assistant_id: str) -> bool:
         """Retrieve an existing assistant by ID."""
+        cached = self._validated_assistants.get(assistant_id)
+        if cached is not None:
+            self.assistant = cached
+            return True
+        
         self.progress.start("Retrieving assistant")
         
         try:
@@ -50,11 +77,12 @@ class AssistantManager:
                 assistant_id=assistant_id
             )
             self.progress.stop()
-            print(f"Retrieved assistant: {self.assistant.id}")
+            self._validated_assistants[assistant_id] = self.assistant
+            logger.info(f"Retrieved assistant: {self.assistant.id}")
             return True
         except Exception as e:
             self.progress.stop()
-            print(f"Error retrieving assistant: {e}")
+            logger.error(f"Error retrieving assistant: {e}")
             return False
     
     def create_thread(self) -> str:
@@ -62,14 +90,22 @@ class AssistantManager:
         try:
             thread = self.client.beta.threads.create()
             self.thread_id = thread.id
-            print(f"Thread created with ID: {self.thread_id}")
+            self._no_active_runs = True  # A brand new thread has no runs
+            self._validated_threads.add(thread.id)
+            logger.info(f"Thread created with ID: {self.thread_id}")
             return self.thread_id
         except Exception as e:
-            print(f"Error creating thread: {e}")
+            logger.error(f"Error creating thread: {e}")
             return ""
     
     def get_thread(self, thread_id: str) -> bool:
         """Verify and set an existing thread by ID."""
+        if thread_id in self._validated_threads:
+            if thread_id != self.thread_id:
+                self.thread_id = thread_id
+                self._no_active_runs = False
+            return True
+        
         try:
             self.progress.start("Verifying thread")
             # Test if thread exists by listing messages
@@ -77,23 +113,25 @@ class AssistantManager:
                 thread_id=thread_id
             )
             self.thread_id = thread_id
+            self._no_active_runs = False  # May have runs left from an earlier session
+            self._validated_threads.add(thread_id)
             self.progress.stop()
-            print(f"Thread verified: {self.thread_id}")
+            logger.info(f"Thread verified: {self.thread_id}")
             return True
         except Exception as e:
             self.progress.stop()
-            print(f"Error verifying thread: {e}")
+            logger.error(f"Error verifying thread: {e}")
             return False
     
     def send_message(self, content: str) -> bool:
         """Send a message to the thread."""
         if not self.thread_id:
-            print("Error: No active thread.")
+            logger.error("No active thread.")
             return False
             
         # Check for empty content
         if not content or content.strip() == "":
-            print("Error: Cannot send empty message.")
+            logger.error("Cannot send empty message.")
             return False
         
         try:
@@ -104,69 +142,46 @@ class AssistantManager:
             )
             return True
         except Exception as e:
-            print(f"Error sending message: {e}")
+            logger.error(f"Error sending message: {e}")
             return False
     
     def run_assistant(self, tool_handler: Optional[Callable[[Any], None]] = None) -> bool:
         """Run the assistant on the thread and handle responses."""
         if not self.assistant or not self.thread_id:
-            print("Error: Assistant or thread not initialized.")
+            logger.error("Assistant or thread not initialized.")
             return False
         
         try:
             self.progress.start("⏳ Processing...")
-            run = self.client.beta.threads.runs.create(
-                thread_id=self.thread_id,
-                assistant_id=self.assistant.id
-            )
+            self._no_active_runs = False
             
-            # Poll for the run to complete
-            status_reported = set()  # Track statuses we've already reported
-            while True:
-                run = self.client.beta.threads.runs.retrieve(
+            # Stream the run so completion and the reply arrive together
+            run, message_content = self._stream_run()
+            if run is None:
+                # Streaming unavailable - create the run and poll it instead
+                run = self.client.beta.threads.runs.create(
                     thread_id=self.thread_id,
-                    run_id=run.id
+                    assistant_id=self.assistant.id
                 )
-                
-                # Only report status changes, with simplified messages
-                if run.status not in status_reported:
-                    if run.status == "queued":
-                        # Skip queued status - too brief to be meaningful
-                        pass
-                    elif run.status == "in_progress":
-                        self.progress.update("⏳ Thinking...")
-                    elif run.status == "requires_action":
-                        self.progress.update("⚙️ Processing...")
-                    status_reported.add(run.status)
-                
-                if run.status == "completed":
-                    break
-                elif run.status == "requires_action":
-                    # Handle tool calls
-                    self.progress.stop()
-                    if tool_handler:
-                        tool_handler(run)
-                    # Reset status tracking
-                    status_reported = set()
-                elif run.status in ["failed", "expired", "cancelled"]:
-                    self.progress.stop()
-                    print(f"❌ Request failed: {run.status}")
+            
+            if run.status != "completed":
+                run = self._poll_run(run, tool_handler)
+                # Either way the run has reached a terminal state
+                self._no_active_runs = True
+                if not run:
                     return False
-                
-                time.sleep(0.5)
+                # Anything produced after tool calls was not part of the stream
+                message_content = None
+            else:
+                self._no_active_runs = True
             
             self.progress.stop()
             
-            # Get the latest assistant message
-            messages = self.client.beta.threads.messages.list(
-                thread_id=self.thread_id,
-                order="desc",
-                limit=1
-            )
+            # Only fetch the latest message if the stream didn't give us one
+            if message_content is None:
+                message_content = self._get_latest_assistant_message()
             
-            latest_message = messages.data[0]
-            if latest_message.role == "assistant":
-                message_content = latest_message.content[0].text.value
+            if message_content is not None:
                 print("\nAssistant:", message_content)
                 
                 # Call message received callback
@@ -181,14 +196,109 @@ class AssistantManager:
             
         except Exception as e:
             self.progress.stop()
-            print(f"Error running assistant: {e}")
+            logger.error(f"Error running assistant: {e}")
             return False
     
+    def _stream_run(self) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Start a run using the streaming API.
+        
+        Returns:
+            The run as of its last lifecycle event and the text of the last
+            assistant message, or (None, None) if streaming is unavailable
+        """
+        runs = self.client.beta.threads.runs
+        if not hasattr(runs, "stream"):
+            return None, None
+        
+        run = None
+        message_parts: Optional[List[str]] = None
+        with runs.stream(thread_id=self.thread_id, assistant_id=self.assistant.id) as stream:
+            for event in stream:
+                event_type = event.event
+                if event_type == "thread.message.created":
+                    message_parts = []
+                elif event_type == "thread.message.delta" and message_parts is not None:
+                    for part in event.data.delta.content or []:
+                        if part.type == "text" and part.text and part.text.value:
+                            message_parts.append(part.text.value)
+                elif event_type.startswith("thread.run.") and not event_type.startswith("thread.run.step."):
+                    run = event.data
+                    if event_type == "thread.run.in_progress":
+                        self.progress.update("⏳ Thinking...")
+        
+        if message_parts is None:
+            return run, None
+        return run, "".join(message_parts)
+    
+    def _poll_run(self, run: Any, tool_handler: Optional[Callable[[Any], None]] = None) -> Optional[Any]:
+        """
+        Poll a run until it completes, handling any required actions.
+        
+        Returns:
+            The completed run, or None if it failed
+        """
+        # Poll for the run to complete, backing off while the status is unchanged
+        last_status = None  # Last status we reported
+        delay = POLL_INITIAL_DELAY
+        while True:
+            run = self.client.beta.threads.runs.retrieve(
+                thread_id=self.thread_id,
+                run_id=run.id
+            )
+            
+            # Only report status changes, with simplified messages
+            if run.status != last_status:
+                if run.status == "queued":
+                    # Skip queued status - too brief to be meaningful
+                    pass
+                elif run.status == "in_progress":
+                    self.progress.update("⏳ Thinking...")
+                elif run.status == "requires_action":
+                    self.progress.update("⚙️ Processing...")
+                last_status = run.status
+                delay = POLL_INITIAL_DELAY
+            
+            if run.status == "completed":
+                return run
+            elif run.status == "requires_action":
+                # Handle tool calls
+                self.progress.stop()
+                if tool_handler:
+                    tool_handler(run)
+                # Reset status tracking
+                last_status = None
+                delay = POLL_INITIAL_DELAY
+            elif run.status in ["failed", "expired", "cancelled"]:
+                self.progress.stop()
+                logger.error(f"❌ Request failed: {run.status}")
+                return None
+            
+            time.sleep(delay)
+            delay = min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
+    
+    def _get_latest_assistant_message(self) -> Optional[str]:
+        """Fetch the latest message on the thread if it came from the assistant."""
+        messages = self.client.beta.threads.messages.list(
+            thread_id=self.thread_id,
+            order="desc",
+            limit=1
+        )
+        
+        latest_message = messages.data[0]
+        if latest_message.role == "assistant":
+            return latest_message.content[0].text.value
+        return None
+    
     def cancel_active_runs(self) -> bool:
         """Cancel any active runs on the current thread."""
         if not self.thread_id:
             return False
         
+        if self._no_active_runs:
+            # Every run we started has finished, so there is nothing to cancel
+            return True
+        
         try:
             self.progress.start("Checking for active runs")
             # List all runs for the thread
@@ -202,25 +312,26 @@ class AssistantManager:
             
             # Cancel active runs
             for run_id in active_runs:
-                print(f"Cancelling active run: {run_id}")
+                logger.info(f"Cancelling active run: {run_id}")
                 try:
                     self.client.beta.threads.runs.cancel(
                         thread_id=self.thread_id,
                         run_id=run_id
                     )
-                    print(f"Successfully cancelled run: {run_id}")
+                    logger.info(f"Successfully cancelled run: {run_id}")
                 except Exception as e:
-                    print(f"Error cancelling run {run_id}: {e}")
+                    logger.error(f"Error cancelling run {run_id}: {e}")
             
             # Wait for cancellations to complete
             if active_runs:
-                print("Waiting for run cancellation to complete...")
+                logger.info("Waiting for run cancellation to complete...")
                 time.sleep(2)
             
+            self._no_active_runs = True
             self.progress.stop()
             return True
             
         except Exception as e:
             self.progress.stop()
-            print(f"Error checking for active runs: {e}")
+            logger.error(f"Error checking for active runs: {e}")
             return False
\ No newline at end of file
@@ -0,0 +1,161 @@
+# managers/async_writer.py
+import time
+import logging
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for further changes before writing the project to disk
+SAVE_DEBOUNCE_SECONDS = 0.25
+# Longest a change may stay unwritten while further changes keep arriving
+SAVE_MAX_DELAY_SECONDS = 2.0
+# Longest close() waits for the writer thread to exit
+CLOSE_TIMEOUT_SECONDS = 5.0
+
+class AsyncProjectWriter:
+    """
+    Saves a project on a background thread, coalescing saves requested in quick succession.
+    
+    Requesting a save only marks the project pending and moves a deadline.
+    A single writer thread calls the write function once the deadline has
+    passed, and the write always takes the project's latest state, so any
+    number of requests in between cost one write.
+    """
+    
+    def __init__(
+        self,
+        write: Callable[[], bool],
+        debounce_seconds: float = SAVE_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = SAVE_MAX_DELAY_SECONDS
+    ):
+        """
+        Initialize the writer.
+        
+        Args:
+            write: Function that saves the project, returning True on success
+            debounce_seconds: Quiet period to wait for before writing
+            max_delay_seconds: Longest a requested save may be deferred
+        """
+        self._write = write
+        self._debounce_seconds = debounce_seconds
+        self._max_delay_seconds = max_delay_seconds
+        
+        # _cond guards the pending state; _write_lock is held only around writes
+        self._lock = threading.RLock()
+        self._cond = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._pending = False
+        self._pending_since = 0.0  # time.monotonic() when a save was first requested
+        self._deadline: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = threading.Event()
+    
+    @property
+    def pending(self) -> bool:
+        """Whether a requested save has not been written yet."""
+        return self._pending
+    
+    def schedule(self) -> None:
+        """Request a save, to be written once changes stop arriving."""
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._pending = True
+                self._pending_since = now
+            
+            shut_down = self._shutdown.is_set()
+            if not shut_down:
+                # Wait for things to go quiet, but not past the deadline
+                delay = min(
+                    self._debounce_seconds,
+                    max(0.0, self._pending_since + self._max_delay_seconds - now)
+                )
+                self._deadline = now + delay
+                
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="project-writer", daemon=True
+                    )
+                    self._thread.start()
+                self._cond.notify()
+        
+        if shut_down:
+            # No writer thread any more, so write straight away
+            self._write_pending()
+    
+    def flush(self) -> bool:
+        """
+        Write any pending save immediately.
+        
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        return self._write_pending()
+    
+    def close(self) -> bool:
+        """
+        Write any pending save and stop the writer thread.
+        
+        Saves requested afterwards are written synchronously.
+        
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        saved = self.flush()
+        with self._cond:
+            self._shutdown.set()
+            self._cond.notify()
+        
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(CLOSE_TIMEOUT_SECONDS)
+        return saved
+    
+    def _write_pending(self) -> bool:
+        """
+        Call the write function if a save is pending.
+        
+        Only _write_lock is held during the write, so schedule() never waits
+        on serialization or disk I/O, while flush() still waits for a write
+        already in progress.
+        
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        with self._write_lock:
+            with self._cond:
+                if not self._pending:
+                    return True
+                self._pending = False
+                self._deadline = None
+            
+            if self._write():
+                return True
+            
+            with self._cond:
+                # Leave the save pending for the next request or flush
+                self._pending = True
+            return False
+    
+    def _run(self) -> None:
+        """Writer loop - writes whenever the deadline passes, until closed."""
+        while True:
+            with self._cond:
+                while not self._shutdown.is_set():
+                    if self._deadline is None:
+                        self._cond.wait()
+                        continue
+                    
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # Woken early if another request moves the deadline
+                    self._cond.wait(remaining)
+                
+                if self._shutdown.is_set():
+                    break
+                self._deadline = None
+            
+            self._write_pending()
+        logger.debug("Project writer stopped")
@@ -1,15 +1,26 @@
 # managers/conversation_flow.py
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence, Tuple
 
 from models.project import ProjectData
 from models.suggestions import SuggestionItem
 from managers.assistant_manager import AssistantManager
 from managers.interaction_recorder import InteractionRecorder
 from utils.event_bus import EventBus
+from utils.events import (
+    TOPIC_ASSISTANT_MESSAGE, TOPIC_CONVERSATION_STARTED,
+    TOPIC_GET_CURRENT_PROJECT, TOPIC_MESSAGE_SENT, TOPIC_PROJECT_NAME_SELECTED,
+    TOPIC_RUN_COMPLETED, TOPIC_THREAD_CREATED
+)
 
 logger = logging.getLogger(__name__)
 
+# Quotes the assistant sometimes wraps suggested project names in
+_QUOTE_CHARS = '"\''
+
+# Project stages in which a conversation picks up where it left off
+_CONTINUING_STAGES = frozenset({"scoping", "complete"})
+
 class ConversationFlow:
     """
     Manages the flow of conversation between user and assistant.
@@ -38,6 +49,9 @@ class ConversationFlow:
         self.interaction_recorder = interaction_recorder
         self.event_bus = event_bus
         
+        # (state_version, category, suggestions) last read from the tool coordinator
+        self._cached_coord: Optional[Tuple[int, Optional[str], Tuple[SuggestionItem, ...]]] = None
+        
         # Setup assistant manager callbacks
         self.assistant_manager.on_message_received = self._on_assistant_message
         self.assistant_manager.on_run_completed = self._on_run_completed
@@ -66,7 +80,7 @@ class ConversationFlow:
                 
             # Publish event if event bus exists
             if self.event_bus:
-                self.event_bus.publish("conversation_started", project)
+                self.event_bus.publish(TOPIC_CONVERSATION_STARTED, project)
         except Exception as e:
             logger.error(f"Error starting conversation: {e}")
             print(f"Error starting conversation: {e}")
@@ -85,27 +99,23 @@ class ConversationFlow:
             logger.error("Cannot process message: No project provided")
             return
         
+        event_bus = self.event_bus
         try:
             # Process potential suggestion selection
             processed_message = self._process_suggestion_input(message, project)
             
             # Send to assistant
-            if not self.assistant_manager.send_message(processed_message):
-                # Try recovery by cancelling runs
-                logger.warning("Send failed. Attempting recovery by cancelling runs.")
-                self.assistant_manager.cancel_active_runs()
-                
-                if not self.assistant_manager.send_message(processed_message):
-                    logger.error("Failed to send message even after recovery attempt")
-                    print("Failed to send message. Please try again.")
-                    return
+            if not self._send_with_recovery(processed_message):
+                logger.error("Failed to send message even after recovery attempt")
+                print("Failed to send message. Please try again.")
+                return
             
             # Clear suggestions after sending
             self.tool_coordinator.clear_suggestions()
             
             # Publish event if event bus exists
-            if self.event_bus:
-                self.event_bus.publish("message_sent", {
+            if event_bus:
+                event_bus.publish(TOPIC_MESSAGE_SENT, {
                     "project": project,
                     "message": processed_message
                 })
@@ -123,7 +133,7 @@ class ConversationFlow:
         Returns:
             True if continuing an existing project, False otherwise
         """
-        return (project.stage in ['scoping', 'complete'] and project.name)
+        return (project.stage in _CONTINUING_STAGES and project.name)
     
     def _continue_existing_project(self, project: ProjectData) -> None:
         """
@@ -158,20 +168,46 @@ class ConversationFlow:
         Args:
             content: The message content
         """
-        if not self.assistant_manager.send_message(content):
+        if not self._send_with_recovery(content, recreate_thread=True):
+            logger.error("Failed to send initial message after retry")
+            print("Failed to send initial message. Please try again.")
+    
+    def _send_with_recovery(self, content: str, recreate_thread: bool = False) -> bool:
+        """
+        Send a message, retrying once after a recovery step if it fails.
+        
+        Args:
+            content: The message content
+            recreate_thread: Recover by creating a new thread instead of
+                cancelling active runs
+            
+        Returns:
+            True if the message was sent, False otherwise
+        """
+        assistant_manager = self.assistant_manager
+        
+        # A run left over from an earlier turn (e.g. one that errored out)
+        # would make the send fail, so clear it first instead of after
+        if assistant_manager.run_may_be_active:
+            assistant_manager.cancel_active_runs()
+        
+        if assistant_manager.send_message(content):
+            return True
+        
+        if recreate_thread:
             logger.warning("Error sending message. Creating a new thread.")
             print("Error sending message. Creating a new thread.")
             
-            # Create new thread and try again
-            thread_id = self.assistant_manager.create_thread()
-            
-            # Publish thread created event
-            if self.event_bus:
-                self.event_bus.publish("thread_created", thread_id)
-            
-            if not self.assistant_manager.send_message(content):
-                logger.error("Failed to send initial message after retry")
-                print("Failed to send initial message. Please try again.")
+            # Create new thread and publish thread created event. The
+            # existing tool coordinator is repointed at it by the handler.
+            thread_id = assistant_manager.create_thread()
+            if thread_id and self.event_bus:
+                self.event_bus.publish(TOPIC_THREAD_CREATED, thread_id)
+        else:
+            logger.warning("Send failed. Attempting recovery by cancelling runs.")
+            assistant_manager.cancel_active_runs()
+        
+        return assistant_manager.send_message(content)
     
     def _process_suggestion_input(self, user_input: str, project: ProjectData) -> str:
         """
@@ -187,12 +223,13 @@ class ConversationFlow:
         # Get current suggestions from tool coordinator
         current_suggestions = self.tool_coordinator.get_current_suggestions()
         current_category = self.tool_coordinator.get_current_category()
+        interaction_index = self.interaction_recorder.get_latest_index(project)
         
         if not current_suggestions:
             # Record as custom input with no suggestions
             self.interaction_recorder.record_response(
                 project=project,
-                interaction_index=self.interaction_recorder.get_latest_index(project),
+                interaction_index=interaction_index,
                 custom_input=user_input,
                 is_custom=True
             )
@@ -201,7 +238,9 @@ class ConversationFlow:
         # Check if input is a number selecting from the list
         selected_suggestion = self._check_for_suggestion_selection(user_input, current_suggestions)
         if selected_suggestion:
-            return self._handle_suggestion_selection(selected_suggestion, project, current_category)
+            return self._handle_suggestion_selection(
+                selected_suggestion, project, current_category, interaction_index
+            )
         
         # Handle project name input
         if current_category == "project_name":
@@ -210,32 +249,40 @@ class ConversationFlow:
         # Record as custom input
         self.interaction_recorder.record_response(
             project=project,
-            interaction_index=self.interaction_recorder.get_latest_index(project),
+            interaction_index=interaction_index,
             custom_input=user_input,
             is_custom=True
         )
         return user_input
     
-    def _check_for_suggestion_selection(self, user_input: str, suggestions: list) -> Optional[SuggestionItem]:
+    def _check_for_suggestion_selection(self, user_input: str, suggestions: Sequence[SuggestionItem]) -> Optional[SuggestionItem]:
         """
-        Check if the user input is selecting a suggestion by number.
+        Check if the user input is selecting a suggestion by number or by its text.
         
         Args:
             user_input: Raw user input
-            suggestions: List of available suggestions
+            suggestions: Available suggestions
             
         Returns:
             Selected suggestion or None
         """
-        try:
-            selection_idx = int(user_input) - 1
-            if 0 <= selection_idx < len(suggestions):
-                return suggestions[selection_idx]
-        except ValueError:
-            pass
+        # Most input is free-form text, so check before paying for int() failing
+        selection = user_input.strip()
+        if not selection.isdecimal():
+            return self.tool_coordinator.find_suggestion_by_text(selection)
+        
+        selection_idx = int(selection) - 1
+        if 0 <= selection_idx < len(suggestions):
+            return suggestions[selection_idx]
         return None
     
-    def _handle_suggestion_selection(self, suggestion: SuggestionItem, project: ProjectData, category: str) -> str:
+    def _handle_suggestion_selection(
+        self,
+        suggestion: SuggestionItem,
+        project: ProjectData,
+        category: str,
+        interaction_index: int
+    ) -> str:
         """
         Handle when user selects a suggestion.
         
@@ -243,6 +290,7 @@ class ConversationFlow:
             suggestion: The selected suggestion
             project: Current project
             category: The suggestion category
+            interaction_index: Index of the interaction being answered
             
         Returns:
             Text to send to assistant
@@ -253,7 +301,7 @@ class ConversationFlow:
         # Record the selection
         self.interaction_recorder.record_response(
             project=project,
-            interaction_index=self.interaction_recorder.get_latest_index(project),
+            interaction_index=interaction_index,
             selection_text=suggestion.text,
             selection_id=suggestion.id,
             is_custom=False
@@ -261,7 +309,7 @@ class ConversationFlow:
         
         # Handle project name selection
         if category == "project_name":
-            project_name = suggestion.text.strip('"\'')
+            project_name = suggestion.text.strip(_QUOTE_CHARS)
             self._publish_project_name_update(project_name, project)
         
         return suggestion.text
@@ -275,7 +323,7 @@ class ConversationFlow:
             project: Current project
         """
         if self.event_bus:
-            self.event_bus.publish("project_name_selected", {
+            self.event_bus.publish(TOPIC_PROJECT_NAME_SELECTED, {
                 "name": name,
                 "project": project
             })
@@ -287,20 +335,15 @@ class ConversationFlow:
         Args:
             message: Assistant's message content
         """
-        if self.event_bus:
-            self.event_bus.publish("assistant_message", message)
-        
-        # Extract question
-        question = self._extract_assistant_question(message)
+        event_bus = self.event_bus
+        if not event_bus:
+            return
         
-        # Get current category from tool coordinator
-        current_category = self.tool_coordinator.get_current_category()
-        current_suggestions = self.tool_coordinator.get_current_suggestions()
+        event_bus.publish(TOPIC_ASSISTANT_MESSAGE, message)
         
-        # Get the current project via event
-        if self.event_bus:
-            self.event_bus.publish("get_current_project", None)
-            # The project will be provided via callback
+        # Get the current project via event - the question is extracted and
+        # recorded in set_current_project once it arrives
+        event_bus.publish(TOPIC_GET_CURRENT_PROJECT, None)
     
     def set_current_project(self, project: ProjectData) -> None:
         """
@@ -316,8 +359,7 @@ class ConversationFlow:
         last_message = self._get_last_assistant_message()
         if last_message:
             question = self._extract_assistant_question(last_message)
-            current_category = self.tool_coordinator.get_current_category()
-            current_suggestions = self.tool_coordinator.get_current_suggestions()
+            current_category, current_suggestions = self._get_coord()
             
             # Record the question
             self.interaction_recorder.record_question(
@@ -327,6 +369,27 @@ class ConversationFlow:
                 current_suggestions
             )
     
+    def _get_coord(self) -> Tuple[Optional[str], Tuple[SuggestionItem, ...]]:
+        """
+        Get the tool coordinator's current category and suggestions.
+        
+        The values are cached and only re-fetched when the coordinator's
+        state version changes.
+        
+        Returns:
+            Tuple of (category, suggestions)
+        """
+        version = getattr(self.tool_coordinator, "state_version", None)
+        cached = self._cached_coord
+        if version is None or cached is None or cached[0] != version:
+            cached = (
+                version,
+                self.tool_coordinator.get_current_category(),
+                self.tool_coordinator.get_current_suggestions()
+            )
+            self._cached_coord = cached
+        return cached[1], cached[2]
+    
     def _get_last_assistant_message(self) -> Optional[str]:
         """
         Get the last message from the assistant.
@@ -348,18 +411,15 @@ class ConversationFlow:
         Returns:
             Extracted question or the last sentence
         """
-        # Simple extraction - get the last sentence ending with a question mark
-        sentences = message.split('.')
-        questions = [s.strip() + '.' for s in sentences if '?' in s]
-        
-        if questions:
-            return questions[-1]  # Return the last question
+        # Simple extraction - get the last sentence ending with a question mark,
+        # scanning back from the last '?' to the end of the previous sentence
+        end = message.rfind('?')
+        if end != -1:
+            start = max(message.rfind('.', 0, end), message.rfind('!', 0, end), message.rfind('?', 0, end)) + 1
+            return message[start:end + 1].strip()  # Return the last question
         
         # If no question mark, just return the last sentence
-        if sentences:
-            return sentences[-1].strip() + '.'
-        
-        return message  # Fallback
+        return message[message.rfind('.') + 1:].strip() + '.'
     
     def _on_run_completed(self, run: Any) -> None:
         """
@@ -369,4 +429,4 @@ class ConversationFlow:
             run: Run object from Assistant API
         """
         if self.event_bus:
-            self.event_bus.publish("run_completed", run)
\ No newline at end of file
+            self.event_bus.publish(TOPIC_RUN_COMPLETED, run)
\ No newline at end of file
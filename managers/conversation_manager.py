@@ -11,6 +11,9 @@ from managers.interaction_recorder import InteractionRecorder
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Quotes the assistant sometimes wraps suggested project names in
+_QUOTE_CHARS = '"\''
+
 class ConversationManager:
     """Manages conversation flow with the assistant."""
     
@@ -44,43 +47,47 @@ class ConversationManager:
             Processed message ready to send to assistant
         """
         logger.debug(f"Processing message: {message}")
+        interaction_index = self.interaction_recorder.get_latest_index(project)
         
         if not self.tool_manager or not self.tool_manager.current_suggestions:
             # Record as custom input with no suggestions
             self.interaction_recorder.record_response(
                 project=project,
-                interaction_index=self.interaction_recorder.get_latest_index(project),
+                interaction_index=interaction_index,
                 custom_input=message,
                 is_custom=True
             )
             return message
         
-        return self._process_suggestion_input(message, project)
+        return self._process_suggestion_input(message, project, interaction_index)
     
-    def _process_suggestion_input(self, user_input: str, project: ProjectData) -> str:
+    def _process_suggestion_input(self, user_input: str, project: ProjectData, interaction_index: int) -> str:
         """
         Process user input for suggestion selection and record the interaction.
         
         Args:
             user_input: Raw user input
             project: Current project data
+            interaction_index: Index of the interaction being answered
             
         Returns:
             Processed message to send
         """
+        is_name = self._is_project_name_selection()
+        
         # Check if input is a number selecting from the list
         selected_suggestion = self._check_for_suggestion_selection(user_input)
         if selected_suggestion:
-            return self._handle_suggestion_selection(selected_suggestion, project)
+            return self._handle_suggestion_selection(selected_suggestion, project, interaction_index, is_name)
         
         # Handle project name input
-        if self._is_project_name_selection():
+        if is_name:
             self._handle_project_name_update(user_input, project)
         
         # Record as custom input
         self.interaction_recorder.record_response(
             project=project,
-            interaction_index=self.interaction_recorder.get_latest_index(project),
+            interaction_index=interaction_index,
             custom_input=user_input,
             is_custom=True
         )
@@ -88,7 +95,7 @@ class ConversationManager:
     
     def _check_for_suggestion_selection(self, user_input: str) -> Optional[SuggestionItem]:
         """
-        Check if the input is selecting a suggestion by number.
+        Check if the input is selecting a suggestion by number or by its text.
         
         Args:
             user_input: Raw user input
@@ -96,23 +103,30 @@ class ConversationManager:
         Returns:
             Selected suggestion or None
         """
-        try:
-            selection_idx = int(user_input) - 1
-            if 0 <= selection_idx < len(self.tool_manager.current_suggestions):
-                return self.tool_manager.current_suggestions[selection_idx]
-        except ValueError:
-            pass
+        # Most input is free-form text, so check before paying for int() failing
+        selection = user_input.strip()
+        if not selection.isdecimal():
+            return self.tool_manager.find_suggestion_by_text(selection)
+        
+        suggestions = self.tool_manager.current_suggestions
+        selection_idx = int(selection) - 1
+        if 0 <= selection_idx < len(suggestions):
+            return suggestions[selection_idx]
         return None
     
     def _handle_suggestion_selection(self, 
                                    suggestion: SuggestionItem, 
-                                   project: ProjectData) -> str:
+                                   project: ProjectData,
+                                   interaction_index: int,
+                                   is_name: Optional[bool] = None) -> str:
         """
         Handle when user selects a suggestion.
         
         Args:
             suggestion: The selected suggestion
             project: Current project data
+            interaction_index: Index of the interaction being answered
+            is_name: Whether this is a project name selection, if already known
             
         Returns:
             Text to send to assistant
@@ -123,15 +137,17 @@ class ConversationManager:
         # Record the selection
         self.interaction_recorder.record_response(
             project=project,
-            interaction_index=self.interaction_recorder.get_latest_index(project),
+            interaction_index=interaction_index,
             selection_text=suggestion.text,
             selection_id=suggestion.id,
             is_custom=False
         )
         
         # Handle project name selection
-        if self._is_project_name_selection():
-            project_name = suggestion.text.strip('"\'')
+        if is_name is None:
+            is_name = self._is_project_name_selection()
+        if is_name:
+            project_name = suggestion.text.strip(_QUOTE_CHARS)
             self._handle_project_name_update(project_name, project)
         
         return suggestion.text
@@ -1,12 +1,55 @@
 # managers/data_manager.py
 import os
-import json
-import glob
-from typing import List, Dict, Any, Optional, Union
+import re
+import logging
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Set, Union, Tuple
 from datetime import datetime
 
+from utils import serialization
 from models.project import ProjectData
-from models.interaction import InteractionRecord
+from models.interaction import InteractionRecord, InteractionHistory
+
+logger = logging.getLogger(__name__)
+
+# Top-level keys needed to list a project without validating the whole file
+_LIST_HEADER_KEYS = ('name', 'created_at', 'last_modified', 'completion_percentage')
+
+# Persisted copy of the project list cache, so a fresh process can skip unchanged files
+_INDEX_FILENAME = ".projects_index.json"
+
+# Upper bound on threads used to read changed project files
+_MAX_LIST_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+# Number of parsed project files kept in memory for repeat loads
+_PROJECT_CACHE_SIZE = 32
+
+# Interaction history is kept in an append-only log next to each project file
+_HISTORY_LOG_SUFFIX = ".jsonl"
+
+# A log is rewritten once it holds this many lines per interaction, since
+# updated interactions leave their earlier snapshots behind
+_LOG_COMPACT_RATIO = 2
+
+# Anything other than a letter or digit becomes '_' in file names. \W is used
+# rather than [^A-Za-z0-9] so non-ASCII names map to the same files as before.
+_SAFE_NAME_RE = re.compile(r'\W')
+
+@functools.lru_cache(maxsize=256)
+def _safe_name(name: str) -> str:
+    """Convert a project name into a safe file name stem."""
+    return _SAFE_NAME_RE.sub('_', name)
+
+class PreparedSave(NamedTuple):
+    """A project's changes, serialized and ready to be written from any thread."""
+    project: ProjectData
+    file_path: str
+    project_bytes: bytes
+    log_path: Optional[str]
+    log_bytes: bytes  # Empty if the log has nothing new
+    log_rewrite: bool  # Replace the log with log_bytes rather than append them
 
 class DataManager:
     """Handles data persistence operations for projects."""
@@ -14,66 +57,457 @@ class DataManager:
     def __init__(self, projects_dir="projects"):
         """Initialize the data manager with the projects directory."""
         self.projects_dir = projects_dir
+        # Project list entries keyed by file path, with the (mtime_ns, size) they were read at
+        self._list_cache: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+        self._index_path = os.path.join(projects_dir, _INDEX_FILENAME)
+        self._index_loaded = False
+        # Last top-level dict written for each project file, as (project uid, dict)
+        self._saved_dicts: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # Last full listing, sorted, reused while no project file has changed
+        self._list_snapshot: Optional[List[Dict[str, str]]] = None
+        # Parsed project payloads keyed by path, with the file signatures they were read at
+        self._project_cache: "OrderedDict[str, Tuple[Tuple[int, ...], Dict[str, Any], Optional[int]]]" = OrderedDict()
         # Ensure projects directory exists
         os.makedirs(self.projects_dir, exist_ok=True)
     
     def load_projects_list(self) -> List[Dict[str, str]]:
         """Load list of existing projects from the projects directory."""
-        project_files = glob.glob(os.path.join(self.projects_dir, "*.json"))
+        if not self._index_loaded:
+            self._load_index()
+        
         projects = []
+        seen = set()
+        misses = []  # (file_path, stat) for files that need to be parsed
         
-        for file_path in project_files:
-            try:
-                with open(file_path, 'r') as f:
-                    project_dict = json.load(f)
-                    project_data = ProjectData.model_validate(project_dict)
-                    projects.append({
-                        'name': project_data.name,
-                        'file_path': file_path,
-                        'created_at': project_data.created_at,
-                        'last_modified': project_data.last_modified,
-                        'completion': f"{project_data.get_completion_percentage()}%"
-                    })
-            except Exception as e:
-                print(f"Error loading project from {file_path}: {e}")
+        with os.scandir(self.projects_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                
+                file_path = entry.path
+                seen.add(file_path)
+                try:
+                    # Reuse the cached entry if the file hasn't changed since it was parsed
+                    st = entry.stat()
+                    cached = self._list_cache.get(file_path)
+                    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                        projects.append(dict(cached[2]))
+                    else:
+                        misses.append((file_path, st))
+                except Exception as e:
+                    print(f"Error loading project from {file_path}: {e}")
+        
+        # Read changed files concurrently - this is I/O bound
+        if len(misses) > 1:
+            workers = min(_MAX_LIST_WORKERS, len(misses))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._load_list_entry, [path for path, _ in misses]))
+        else:
+            results = [self._load_list_entry(path) for path, _ in misses]
+        
+        for (file_path, st), project_info in zip(misses, results):
+            if project_info is not None:
+                self._list_cache[file_path] = (st.st_mtime_ns, st.st_size, project_info)
+                projects.append(dict(project_info))
+        index_changed = bool(misses)
+        
+        # Drop cache entries for files that no longer exist
+        for file_path in self._list_cache.keys() - seen:
+            del self._list_cache[file_path]
+            index_changed = True
+        
+        if index_changed:
+            self._save_index()
+        
+        # Every file was stat'ed above, so in-place edits show up as misses;
+        # with no misses or removals the last listing still holds
+        snapshot = self._list_snapshot
+        if snapshot is not None and not index_changed and len(snapshot) == len(projects):
+            return [dict(project_info) for project_info in snapshot]
         
         # Sort by last modified, newest first
-        return sorted(projects, key=lambda x: x['last_modified'], reverse=True)
+        projects.sort(key=lambda x: x['last_modified'], reverse=True)
+        self._list_snapshot = [dict(project_info) for project_info in projects]
+        return projects
+    
+    def _load_list_entry(self, file_path: str) -> Optional[Dict[str, str]]:
+        """Read one project file and build its list entry, or None on error."""
+        try:
+            project_dict = serialization.loads(self._read_bytes(file_path))
+            return self._project_list_entry(project_dict, file_path)
+        except Exception as e:
+            print(f"Error loading project from {file_path}: {e}")
+            return None
+    
+    def _project_list_entry(self, project_dict: Dict[str, Any], file_path: str) -> Dict[str, str]:
+        """Build a project list entry from a parsed project file."""
+        if all(key in project_dict for key in _LIST_HEADER_KEYS):
+            # Read the header fields directly instead of validating the whole project
+            name = project_dict['name']
+            created_at = project_dict['created_at']
+            last_modified = project_dict['last_modified']
+            completion = project_dict['completion_percentage']
+        else:
+            # Legacy file without a stored completion percentage
+            project_data = ProjectData.model_validate(project_dict)
+            name = project_data.name
+            created_at = project_data.created_at
+            last_modified = project_data.last_modified
+            completion = project_data.get_completion_percentage()
+        
+        return {
+            'name': name,
+            'file_path': file_path,
+            'created_at': created_at,
+            'last_modified': last_modified,
+            'completion': f"{completion}%"
+        }
+    
+    def _load_index(self) -> None:
+        """Seed the project list cache from the on-disk index, if there is one."""
+        self._index_loaded = True
+        try:
+            index = serialization.loads(self._read_bytes(self._index_path))
+            for file_path, (mtime_ns, size, project_info) in index.items():
+                self._list_cache.setdefault(file_path, (mtime_ns, size, project_info))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # A bad index only costs us a full rescan
+            print(f"Ignoring unreadable projects index: {e}")
+    
+    def _save_index(self) -> None:
+        """Write the project list cache to the on-disk index."""
+        try:
+            self._atomic_write(self._index_path, serialization.dumps(self._list_cache))
+        except Exception as e:
+            print(f"Error saving projects index: {e}")
+    
+    def invalidate(self, file_path: str) -> None:
+        """Drop any cached project list entry for a file."""
+        self._list_cache.pop(file_path, None)
+        self._project_cache.pop(file_path, None)
+        self._list_snapshot = None
     
     def load_project(self, file_path: str) -> Optional[ProjectData]:
         """Load a project from a file path."""
         try:
-            with open(file_path, 'r') as f:
-                project_dict = json.load(f)
-                return ProjectData.model_validate(project_dict)
+            log_path = self._history_log_path(file_path)
+            signature = self._file_signature(file_path) + self._file_signature(log_path)
+            
+            cached = self._project_cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                self._project_cache.move_to_end(file_path)
+                _, project_dict, num_lines = cached
+            else:
+                project_dict, num_lines = self._read_project_dict(file_path, log_path)
+                self._project_cache[file_path] = (signature, project_dict, num_lines)
+                if len(self._project_cache) > _PROJECT_CACHE_SIZE:
+                    self._project_cache.popitem(last=False)
+            
+            # Validation builds fresh objects, so the cached dict is never shared
+            project = ProjectData.model_validate(project_dict)
+            
+            # Mark the history as in sync with its log, unless the log has
+            # accumulated enough superseded lines to be worth rewriting
+            num_interactions = len(project_dict['interaction_history']['interactions'])
+            if num_lines is not None and not self._log_needs_compaction(num_lines, num_interactions):
+                project.interaction_history._log_path = log_path
+                project.interaction_history._log_lines = num_lines
+            return project
         except Exception as e:
             print(f"Error loading project: {e}")
             return None
     
+    def _read_project_dict(self, file_path: str, log_path: str) -> Tuple[Dict[str, Any], Optional[int]]:
+        """
+        Read a project file and replay its interaction log into it.
+        
+        Returns:
+            The project dict and the number of log lines read (None if there
+            is no log, or it ends in a partial line and must be rewritten)
+        """
+        project_dict = serialization.loads(self._read_bytes(file_path))
+        
+        # Rebuild the interaction history from the log if there is one
+        interactions, num_lines = self._read_history_log(log_path)
+        if interactions is not None:
+            project_dict['interaction_history'] = {'interactions': interactions}
+            return project_dict, num_lines
+        
+        if 'interaction_history' not in project_dict:
+            project_dict['interaction_history'] = {'interactions': []}
+        return project_dict, None
+    
+    def _file_signature(self, file_path: str) -> Tuple[int, int]:
+        """Get a file's (mtime_ns, size), or (0, -1) if it doesn't exist."""
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return 0, -1
+        return st.st_mtime_ns, st.st_size
+    
     def save_project(self, project: ProjectData) -> str:
         """Save a project to file and return the file path."""
+        try:
+            prepared = self.prepare_save(project)
+        except Exception as e:
+            print(f"Error saving project: {e}")
+            return ""
+        
+        if prepared is None:
+            # Nothing changed since we last wrote this project
+            return self._project_file_path(project)
+        return self.write_prepared([prepared])
+    
+    def prepare_save(self, project: ProjectData) -> Optional[PreparedSave]:
+        """
+        Serialize a project's unsaved changes for write_prepared().
+        
+        Call this on the thread that changes the project. The change tracking
+        is reset and everything is dumped here, so the write itself only
+        handles bytes and can run on another thread.
+        
+        Returns:
+            The serialized changes, or None if the file is already up to date
+        """
+        file_path = self._project_file_path(project)
+        if self._is_saved(file_path, project):
+            return None
+        
         project.update_last_modified()
         
-        # Create safe filename
-        safe_name = ''.join(c if c.isalnum() else '_' for c in project.name)
-        file_path = os.path.join(self.projects_dir, f"{safe_name}.json")
+        try:
+            log_path = None
+            log_bytes, log_rewrite = b'', False
+            if project.interaction_history is not None:
+                log_path = self._history_log_path(file_path)
+                log_bytes, log_rewrite = self._prepare_history_log(log_path, project.interaction_history)
+            
+            dirty = project.pop_dirty_fields()
+            project_bytes = self._prepare_project_file(file_path, project, dirty)
+        except BaseException:
+            self._discard_save(project, file_path)
+            raise
+        
+        return PreparedSave(
+            project, file_path, project_bytes, log_path, log_bytes, log_rewrite
+        )
+    
+    def write_prepared(self, saves: Sequence[PreparedSave]) -> str:
+        """
+        Write prepared saves, in the order they were prepared.
+        
+        Every log change is written, but each project file only once, with
+        its latest contents.
+        
+        Returns:
+            The file path of the last save, or "" if writing failed
+        """
+        if not saves:
+            return ""
         
         try:
-            with open(file_path, 'w') as f:
-                json.dump(project.model_dump(), f, indent=2)
-            return file_path
+            # Write the history first so the project file never runs ahead of it
+            for save in saves:
+                if not save.log_bytes:
+                    continue
+                if save.log_rewrite:
+                    self._atomic_write(save.log_path, save.log_bytes)
+                else:
+                    with open(save.log_path, 'ab') as f:
+                        f.write(save.log_bytes)
+            
+            latest = {save.file_path: save for save in saves}
+            for file_path, save in latest.items():
+                self._atomic_write(file_path, save.project_bytes)
+                self.invalidate(file_path)
+            return saves[-1].file_path
         except Exception as e:
+            for save in saves:
+                self._discard_save(save.project, save.file_path)
             print(f"Error saving project: {e}")
             return ""
     
+    def _discard_save(self, project: ProjectData, file_path: str) -> None:
+        """Forget a save that wasn't written, so the next save redoes it in full."""
+        # Every field, not just the ones this save changed: a failed first
+        # save has none, yet the project still isn't on disk
+        project.mark_dirty(*type(project).model_fields)
+        self._saved_dicts.pop(file_path, None)
+        if project.interaction_history is not None:
+            # The log may be partly written, so it gets rewritten
+            project.interaction_history._log_path = None
+    
+    def _project_file_path(self, project: ProjectData) -> str:
+        """Get the file path a project is saved to."""
+        return os.path.join(self.projects_dir, f"{_safe_name(project.name)}.json")
+    
+    def _is_saved(self, file_path: str, project: ProjectData) -> bool:
+        """Check whether the file already holds this project with no changes since."""
+        saved = self._saved_dicts.get(file_path)
+        if saved is None or saved[0] != project.uid or project.has_unsaved_changes():
+            return False
+        history = project.interaction_history
+        return history is None or history._log_path == self._history_log_path(file_path)
+    
+    def _prepare_project_file(self, file_path: str, project: ProjectData, dirty: Set[str]) -> bytes:
+        """
+        Serialize the project file, re-dumping only the given changed fields.
+        
+        The last saved dict is kept per file; when it belongs to the same
+        project, only dirty fields (and the derived completion percentage)
+        are dumped and merged into it. Otherwise the whole project is dumped.
+        """
+        saved = self._saved_dicts.get(file_path)
+        if saved is not None and saved[0] == project.uid:
+            project_dict = dict(saved[1])
+            project_dict.update(project.model_dump(
+                mode='json', include=(dirty - {'interaction_history'}) | {'completion_percentage'}
+            ))
+        else:
+            project_dict = project.model_dump(mode='json', exclude={'interaction_history'})
+        
+        data = serialization.dumps(project_dict, indent=True)
+        self._saved_dicts[file_path] = (project.uid, project_dict)
+        return data
+    
+    def _read_bytes(self, file_path: str) -> bytes:
+        """
+        Read a whole file with a single read sized from its stat.
+        
+        This skips the buffered file object, so the parser gets the raw bytes
+        without an extra copy.
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size)
+            # Short reads are rare for regular files, but not impossible
+            while len(data) < size:
+                chunk = os.read(fd, size - len(data))
+                if not chunk:
+                    break
+                data += chunk
+            return data
+        finally:
+            os.close(fd)
+    
+    def _atomic_write(self, file_path: str, data: bytes) -> None:
+        """
+        Replace a file's contents atomically.
+        
+        The data is written to a temporary file in one call, synced, and then
+        renamed over the destination, so a crash never leaves a partial file.
+        """
+        tmp_path = file_path + ".tmp"
+        try:
+            with open(tmp_path, 'wb', buffering=0) as f:
+                f.write(data)
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _history_log_path(self, file_path: str) -> str:
+        """Get the interaction log path for a project file."""
+        return os.path.splitext(file_path)[0] + _HISTORY_LOG_SUFFIX
+    
+    def _read_history_log(self, log_path: str) -> Tuple[Optional[List[Dict[str, Any]]], Optional[int]]:
+        """
+        Replay an interaction log.
+        
+        Each line holds one interaction snapshot with its index; later lines
+        replace earlier ones for the same index. A final line cut short by a
+        crash mid-append is skipped.
+        
+        Returns:
+            The interaction dicts in order (None if there is no log) and the
+            number of lines read (None if the log has to be rewritten)
+        """
+        if not os.path.exists(log_path):
+            return None, 0
+        
+        records: Dict[int, Dict[str, Any]] = {}
+        num_lines: Optional[int] = 0
+        with open(log_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = serialization.loads(line)
+                except ValueError:
+                    # Only the last line can lack its newline, and only when an
+                    # append was interrupted; anything else is real corruption
+                    if line.endswith(b'\n'):
+                        raise
+                    logger.warning(f"Skipping incomplete last line of {log_path}")
+                    num_lines = None
+                    break
+                records[entry['index']] = entry['record']
+                num_lines += 1
+        
+        return [records[i] for i in sorted(records)], num_lines
+    
+    def _prepare_history_log(self, log_path: str, history: InteractionHistory) -> Tuple[bytes, bool]:
+        """
+        Serialize the changed interactions, or every one if the log isn't in sync.
+        
+        The history is marked in sync with the log as if the lines were
+        already written; a failed write resets that.
+        
+        Returns:
+            The log lines and whether they replace the log rather than extend it
+        """
+        if history._log_path != log_path:
+            # New, renamed or compacted log - write every interaction
+            history.pop_dirty_indices()
+            indices = range(len(history.interactions))
+            rewrite = True
+        else:
+            indices = history.pop_dirty_indices()
+            if not indices:
+                return b'', False
+            rewrite = False
+            
+            # Compact instead of appending once superseded lines pile up
+            if self._log_needs_compaction(history._log_lines + len(indices), len(history.interactions)):
+                indices = range(len(history.interactions))
+                rewrite = True
+        
+        # pydantic-core encodes each record straight to bytes, with no str in between
+        to_json = InteractionRecord.__pydantic_serializer__.to_json
+        lines = [
+            b'{"index":%d,"record":%s}\n' % (i, to_json(history.interactions[i]))
+            for i in indices
+        ]
+        if rewrite:
+            history._log_lines = len(lines)
+        else:
+            history._log_lines += len(lines)
+        history._log_path = log_path
+        return b''.join(lines), rewrite
+    
+    def _log_needs_compaction(self, num_lines: int, num_interactions: int) -> bool:
+        """Check whether a log has enough superseded lines to be worth rewriting."""
+        return num_lines > _LOG_COMPACT_RATIO * max(num_interactions, 1)
+    
     def delete_project_file(self, project_name: str) -> bool:
         """Delete a project file by name."""
-        safe_name = ''.join(c if c.isalnum() else '_' for c in project_name)
+        safe_name = _safe_name(project_name)
         file_path = os.path.join(self.projects_dir, f"{safe_name}.json")
         
         if os.path.exists(file_path):
             try:
                 os.remove(file_path)
+                self.invalidate(file_path)
+                self._saved_dicts.pop(file_path, None)
+                
+                log_path = self._history_log_path(file_path)
+                if os.path.exists(log_path):
+                    os.remove(log_path)
                 return True
             except Exception as e:
                 print(f"Error deleting project file: {e}")
@@ -96,53 +530,78 @@ class DataManager:
     def wipe_all_projects(self) -> bool:
         """Delete all project files (for database reset)."""
         try:
-            project_files = glob.glob(os.path.join(self.projects_dir, "*.json"))
-            for file_path in project_files:
-                os.remove(file_path)
+            # Only remove our own files - the projects directory is configurable
+            # and may be shared, so it is never removed wholesale
+            with os.scandir(self.projects_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.name.endswith((".json", _HISTORY_LOG_SUFFIX)) and entry.is_file():
+                        os.remove(entry.path)
+            self._clear_caches()
             return True
         except Exception as e:
             print(f"Error wiping projects: {e}")
             return False
     
+    def _clear_caches(self) -> None:
+        """Forget every cached project list entry, in memory and on disk."""
+        self._list_cache.clear()
+        self._saved_dicts.clear()
+        self._project_cache.clear()
+        self._list_snapshot = None
+        self._index_loaded = True  # Nothing left worth loading
+        if os.path.exists(self._index_path):
+            os.remove(self._index_path)
+    
     def export_scope_document(self, project: ProjectData, format: str = "md") -> str:
         """Export the project scope as a markdown or JSON document."""
         if format == "json":
             # Return the scope as JSON
-            return json.dumps(project.scope.model_dump(), indent=2)
+            return serialization.dumps(project.scope, indent=True).decode('utf-8')
         else:
             # Create a markdown document
-            md = f"# {project.name} - Project Scope Document\n\n"
-            md += f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
-            md += f"**Project Completion: {project.get_completion_percentage()}%**\n\n"
+            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            parts: List[str] = [
+                f"# {project.name} - Project Scope Document\n\n",
+                f"*Generated on: {generated_at}*\n\n",
+                f"**Project Completion: {project.get_completion_percentage()}%**\n\n"
+            ]
             
             if project.description:
-                md += "## Project Description\n\n"
-                md += f"{project.description}\n\n"
+                parts.append("## Project Description\n\n")
+                parts.append(f"{project.description}\n\n")
             
-            # Add each completed category
+            # Add each completed category; the scope is the saved tool payload,
+            # so categories are plain dicts (or strings in older projects)
+            scope = project.scope
             categories = [
-                ("Project Objectives", project.scope.objective),
-                ("Target Audience", project.scope.audience),
-                ("Deliverables", project.scope.deliverable),
-                ("Timeline", project.scope.timeline),
-                ("Resources", project.scope.resource),
-                ("Risks", project.scope.risk),
-                ("Success Metrics", project.scope.success_metric)
+                ("Project Objectives", scope.get("objective")),
+                ("Target Audience", scope.get("audience")),
+                ("Deliverables", scope.get("deliverable")),
+                ("Timeline", scope.get("timeline")),
+                ("Resources", scope.get("resource")),
+                ("Risks", scope.get("risk")),
+                ("Success Metrics", scope.get("success_metric"))
             ]
             
-            for title, category in categories:
-                if category.is_complete():
-                    md += f"## {title}\n\n"
-                    md += f"{category.value}\n\n"
-                    if category.description:
-                        md += f"*{category.description}*\n\n"
-            
             # Add any additional categories
-            for key, category in project.scope.additional_categories.items():
-                if category.is_complete():
-                    md += f"## {key.replace('_', ' ').title()}\n\n"
-                    md += f"{category.value}\n\n"
-                    if category.description:
-                        md += f"*{category.description}*\n\n"
+            categories.extend(
+                (key.replace('_', ' ').title(), category)
+                for key, category in (scope.get("additional_categories") or {}).items()
+            )
+            
+            for title, category in categories:
+                if isinstance(category, dict):
+                    value, description = category.get("value"), category.get("description")
+                else:
+                    value, description = category, None
+                if value is None or (isinstance(value, str) and not value.strip()):
+                    continue
+                
+                parts.append(f"## {title}\n\n")
+                parts.append(f"{value}\n\n")
+                if description:
+                    parts.append(f"*{description}*\n\n")
             
-            return md
\ No newline at end of file
+            return "".join(parts)
\ No newline at end of file
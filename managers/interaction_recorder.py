@@ -1,6 +1,6 @@
 # managers/interaction_recorder.py
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Sequence, Union
 
 from models.project import ProjectData
 from models.interaction import InteractionRecord
@@ -14,13 +14,13 @@ class InteractionRecorder:
     
     def __init__(self):
         """Initialize the interaction recorder."""
-        self.latest_indices = {}  # Maps project names to latest interaction indices
+        self.latest_indices = {}  # Maps project uids to latest interaction indices
     
     def record_question(self, 
                       project: ProjectData, 
                       question: str, 
                       category: Optional[str] = None,
-                      suggestions: List[SuggestionItem] = None) -> int:
+                      suggestions: Optional[Sequence[SuggestionItem]] = None) -> int:
         """
         Record a question asked by the assistant.
         
@@ -28,7 +28,8 @@ class InteractionRecorder:
             project: Current project data
             question: The question asked
             category: Question category (e.g., "objective", "timeline")
-            suggestions: List of suggestions provided
+            suggestions: Suggestions provided. Stored as an immutable tuple
+                of the same frozen items, so callers can pass live state uncopied
             
         Returns:
             Index of the recorded interaction
@@ -42,14 +43,14 @@ class InteractionRecorder:
             interaction = InteractionRecord(
                 question=question,
                 category=category,
-                suggestions=suggestions or []
+                suggestions=suggestions or ()
             )
             
             # Add to history
             interaction_index = project.interaction_history.add_interaction(interaction)
             
             # Store latest index for this project
-            self.latest_indices[project.name] = interaction_index
+            self.latest_indices[project.uid] = interaction_index
             
             logger.debug(f"Recorded question in category '{category}': {question}")
             return interaction_index
@@ -112,7 +113,7 @@ class InteractionRecorder:
         Returns:
             Latest interaction index or -1 if none exists
         """
-        return self.latest_indices.get(project.name, -1)
+        return self.latest_indices.get(project.uid, -1)
     
     def get_interaction_summary(self, project: ProjectData) -> str:
         """
@@ -1,11 +1,18 @@
 # managers/project_lifecycle_manager.py
 import logging
+import threading
+import contextlib
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 
 from models.project import ProjectData
-from managers.data_manager import DataManager
+from managers.data_manager import DataManager, PreparedSave
+from managers.async_writer import AsyncProjectWriter
 from utils.event_bus import EventBus
+from utils.events import (
+    TOPIC_PROJECT_CREATED, TOPIC_PROJECT_LOADED, TOPIC_PROJECT_SAVED,
+    TOPIC_PROJECT_UPDATED
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +23,11 @@ class ProjectLifecycleManager:
     This class centralizes all project state management and persistence operations.
     """
     
+    # Project fields that may be changed through update_project_metadata
+    _UPDATABLE_FIELDS = frozenset({
+        "name", "description", "status", "stage", "assistant_id", "thread_id", "scope"
+    })
+    
     def __init__(self, data_manager: DataManager, event_bus: Optional[EventBus] = None):
         """
         Initialize the project lifecycle manager.
@@ -27,6 +39,17 @@ class ProjectLifecycleManager:
         self.data_manager = data_manager
         self.event_bus = event_bus
         self.current_project: Optional[ProjectData] = None
+        
+        # Saves are serialized on the caller's thread, then debounced and
+        # written by a background thread
+        self._writer = AsyncProjectWriter(self._write_project)
+        self._prepared: List[PreparedSave] = []
+        self._prepared_lock = threading.Lock()
+        # Set while the last write failed; its changes wait for the next save
+        self._write_failed = False
+        
+        # Fields updated inside a batch() block, or None outside one
+        self._batch_fields: Optional[List[str]] = None
     
     def create_new_project(self, description: str) -> ProjectData:
         """
@@ -41,6 +64,9 @@ class ProjectLifecycleManager:
         try:
             logger.info(f"Creating new project with description: {description}")
             
+            # Don't let pending changes to a previous project go unwritten
+            self.flush_sync()
+            
             # Create default project name
             default_name = f"Project_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
@@ -56,7 +82,7 @@ class ProjectLifecycleManager:
             
             # Publish event if event bus exists
             if self.event_bus:
-                self.event_bus.publish("project_created", self.current_project)
+                self.event_bus.publish(TOPIC_PROJECT_CREATED, self.current_project)
             
             return self.current_project
         except Exception as e:
@@ -75,6 +101,7 @@ class ProjectLifecycleManager:
         """
         try:
             logger.info(f"Loading project from: {file_path}")
+            self.flush_sync()
             project_data = self.data_manager.load_project(file_path)
             
             if not project_data:
@@ -85,7 +112,7 @@ class ProjectLifecycleManager:
             
             # Publish event if event bus exists
             if self.event_bus:
-                self.event_bus.publish("project_loaded", self.current_project)
+                self.event_bus.publish(TOPIC_PROJECT_LOADED, self.current_project)
             
             return self.current_project
         except Exception as e:
@@ -94,44 +121,102 @@ class ProjectLifecycleManager:
     
     def save_project(self) -> bool:
         """
-        Save the current project to file.
+        Schedule the current project to be saved, if it has changed.
         
         Returns:
-            True if saving succeeded, False otherwise
+            True if a save was scheduled, False otherwise
         """
+        project = self.current_project
+        if project is not None and not project.has_unsaved_changes():
+            # Already written, or a write holding these changes is pending
+            return False
         return self._save_project()
     
+    def flush_sync(self) -> bool:
+        """
+        Write any pending changes to the current project immediately.
+        
+        Use at shutdown and other points where the save must not be deferred.
+        Changes that were never scheduled, or whose write failed, are
+        included.
+        
+        Returns:
+            True if nothing was pending or saving succeeded, False otherwise
+        """
+        if self.current_project:
+            self.save_project()
+        return self._writer.flush()
+    
+    def close(self) -> bool:
+        """
+        Write any pending changes and stop the background writer.
+        
+        Returns:
+            True if nothing was pending or saving succeeded, False otherwise
+        """
+        return self._writer.close()
+    
     def _save_project(self) -> bool:
         """
-        Internal method to save the current project.
+        Internal method to schedule a save of the current project.
+        
+        The changes are serialized here, so the background write never reads
+        the project while it is being changed. Several changes in quick
+        succession are coalesced into one write.
         
         Returns:
-            True if saving succeeded, False otherwise
+            True if a save was scheduled, False otherwise
         """
         if not self.current_project:
             logger.warning("Attempted to save project, but no project is active")
             return False
         
+        try:
+            prepared = self.data_manager.prepare_save(self.current_project)
+        except Exception as e:
+            logger.error(f"Error saving project: {e}")
+            return False
+        if prepared is None:
+            # The file already holds these changes
+            return False
+        
+        with self._prepared_lock:
+            self._prepared.append(prepared)
+        self._writer.schedule()
+        return True
+    
+    def _write_project(self) -> bool:
+        """
+        Write the saves prepared since the last write.
+        
+        Returns:
+            True if saving succeeded, False otherwise
+        """
+        with self._prepared_lock:
+            prepared, self._prepared = self._prepared, []
+        if not prepared:
+            # A failed write's changes are marked unsaved again, so only a
+            # newly prepared save can write them
+            return not self._write_failed
+        
         try:
             logger.debug("Saving project")
-            self.current_project.update_last_modified()
             
             # Save to file
-            file_path = self.data_manager.save_project(self.current_project)
+            file_path = self.data_manager.write_prepared(prepared)
             if file_path:
                 logger.debug(f"Project saved to {file_path}")
+                self._write_failed = False
                 
-                # Publish event if event bus exists
-                if self.event_bus:
-                    self.event_bus.publish("project_saved", self.current_project)
+                self._emit(TOPIC_PROJECT_SAVED, prepared[-1].project)
                 
                 return True
             else:
                 logger.error("Failed to save project")
-                return False
         except Exception as e:
             logger.error(f"Error saving project: {e}")
-            return False
+        self._write_failed = True
+        return False
     
     def update_project_metadata(self, key: str, value: Any) -> bool:
         """
@@ -148,33 +233,99 @@ class ProjectLifecycleManager:
             logger.warning("Attempted to update project, but no project is active")
             return False
         
+        if key not in self._UPDATABLE_FIELDS:
+            logger.warning(f"Attempted to update unknown field: {key}")
+            return False
+        
         try:
-            if hasattr(self.current_project, key):
-                setattr(self.current_project, key, value)
-                
-                # Special case for project name updates - rename the file
-                if key == "name":
-                    old_name = self.current_project.name
-                    if old_name and old_name != value:
-                        self.data_manager.delete_project_file(old_name)
-                
-                self._save_project()
-                
-                # Publish event if event bus exists
-                if self.event_bus:
-                    self.event_bus.publish("project_updated", {
-                        "project": self.current_project,
-                        "updated_field": key
-                    })
-                
+            old_name = self.current_project.name
+            
+            # Assignment is still validated by the model (e.g. allowed stages)
+            setattr(self.current_project, key, value)
+            
+            # Special case for project name updates - rename the file
+            if key == "name" and old_name and old_name != value:
+                self._drop_pending_saves()
+                self.data_manager.delete_project_file(old_name)
+            
+            if self._batch_fields is not None:
+                # Saved and announced together when the batch ends
+                if key not in self._batch_fields:
+                    self._batch_fields.append(key)
                 return True
-            else:
-                logger.warning(f"Attempted to update unknown field: {key}")
-                return False
+            
+            self._save_project()
+            self._publish_updated([key])
+            
+            return True
         except Exception as e:
             logger.error(f"Error updating project metadata: {e}")
             return False
     
+    def _drop_pending_saves(self) -> None:
+        """
+        Drop the current project's unwritten saves and wait out any write in progress.
+        
+        They target the file a rename is about to delete, and would otherwise
+        recreate it. The next save writes the project in full under its new
+        name, so nothing is lost.
+        """
+        with self._prepared_lock:
+            self._prepared = [
+                save for save in self._prepared if save.project is not self.current_project
+            ]
+        self._writer.flush()
+    
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group metadata updates into one save and one project_updated event.
+        
+        Nested batches fold into the outermost one.
+        """
+        if self._batch_fields is not None:
+            yield
+            return
+        
+        self._batch_fields = []
+        try:
+            yield
+        finally:
+            fields, self._batch_fields = self._batch_fields, None
+            if fields and self.current_project:
+                self._save_project()
+                self._publish_updated(fields)
+    
+    def _publish_updated(self, fields: List[str]) -> None:
+        """
+        Announce updated project fields.
+        
+        Args:
+            fields: Names of the updated fields, in update order
+        """
+        # Synchronous: the handlers only queue UI text, which must be in place
+        # before the next prompt flushes it
+        if self.event_bus:
+            self.event_bus.publish(TOPIC_PROJECT_UPDATED, {
+                "project": self.current_project,
+                "updated_field": fields[-1],
+                "updated_fields": fields
+            })
+    
+    def _emit(self, event_type: str, data: Any) -> None:
+        """
+        Publish a notification event without waiting for its handlers.
+        
+        Creation, loading and updates still publish synchronously, since the
+        caller depends on their handlers having run.
+        
+        Args:
+            event_type: The type of event being published
+            data: Data associated with the event
+        """
+        if self.event_bus:
+            self.event_bus.publish_async(event_type, data)
+    
     def get_current_project(self) -> Optional[ProjectData]:
         """
         Get the current active project.
@@ -1,24 +1,92 @@
 # managers/project_manager.py
+import os
 import logging
 import sys
 import signal
-from typing import Any, Optional
-
-from openai import OpenAI
+import threading
+import textwrap
+import functools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Final, Iterator, Tuple, TYPE_CHECKING
 
 from utils.event_bus import EventBus
+from utils.events import (
+    TOPIC_ASSISTANT_MESSAGE, TOPIC_EXIT_REQUESTED, TOPIC_GET_CURRENT_PROJECT,
+    TOPIC_MESSAGE_SENT, TOPIC_NEW_PROJECT_REQUESTED, TOPIC_PROJECT_CREATED,
+    TOPIC_PROJECT_FILE_SELECTED, TOPIC_PROJECT_LOADED,
+    TOPIC_PROJECT_NAMES_GENERATED, TOPIC_PROJECT_NAME_SELECTED,
+    TOPIC_PROJECT_SAVED, TOPIC_PROJECT_UPDATED, TOPIC_RUN_COMPLETED,
+    TOPIC_SCOPE_SAVED, TOPIC_SUGGESTIONS_GENERATED, TOPIC_THREAD_CREATED,
+    TOPIC_USER_INPUT
+)
 from managers.data_manager import DataManager
 from managers.ui_manager import UIManager
-from managers.assistant_manager import AssistantManager
 from managers.project_lifecycle_manager import ProjectLifecycleManager
-from managers.conversation_flow import ConversationFlow
-from managers.tool_coordinator import ToolCoordinator
 from managers.ui_coordinator import UICoordinator
-from managers.interaction_recorder import InteractionRecorder
+
+if TYPE_CHECKING:
+    # Conversation components are imported when the first project is opened
+    from openai import OpenAI
+    from managers.assistant_manager import AssistantManager
+    from managers.conversation_flow import ConversationFlow
+    from managers.tool_manager import ToolCoordinator
+    from managers.interaction_recorder import InteractionRecorder
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Signals that trigger a clean shutdown
+_SHUTDOWN_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+# Name and model of the assistant created for each project
+_ASSISTANT_NAME: Final[str] = "Project Scoping Assistant"
+_ASSISTANT_MODEL: Final[str] = "gpt-4o"
+
+# Instructions given to the assistant whenever one is created, built once
+# with the source indentation removed so it isn't sent with every request
+_ASSISTANT_INSTRUCTIONS: Final[str] = textwrap.dedent("""
+        You are a project scoping specialist who helps users define and plan their projects through a 
+        guided, step-by-step conversation. Follow this specific conversational flow:
+
+        1. INITIAL STAGE: The user will provide their project description in the first message. Don't
+        acknowledge the description separately - immediately proceed to the naming stage.
+
+        2. NAMING STAGE: After receiving the project description, in your VERY FIRST response, call 
+        the generate_project_names tool with the description. Do not send any separate acknowledgment 
+        message before generating names.
+        
+        3. SCOPING STAGE: After the user selects or provides a project name, begin the detailed scoping process 
+        by asking ONE question at a time about different aspects of the project:
+        - Ask a focused question
+        - IMMEDIATELY call the generate_suggestions tool to provide options
+        - Wait for the user's response before asking the next question
+        
+        IMPORTANT TIMING GUIDELINES:
+        - Call tools IMMEDIATELY after receiving relevant user information - don't delay
+        - Use generate_project_names immediately in your first response after receiving the initial project description
+        - Use generate_suggestions immediately after asking each scoping question
+        - Use save_scope at the end of the conversation to save all gathered information
+        
+        Cover these key areas during the scoping stage (one question at a time):
+        - Project objectives and specific goals
+        - Target audience or users
+        - Key deliverables
+        - Timeline and milestones
+        - Budget and resources
+        - Potential risks and challenges
+        - Success metrics
+        
+        IMPORTANT: If the user asks to "save progress" or "save our progress", DO NOT attempt to generate a final 
+        scope document. Instead, acknowledge their request and confirm that progress is automatically saved after 
+        each interaction. Let them know they can continue the conversation later by selecting the same project.
+        
+        When the user has answered all the key questions, offer to generate a project scope document by 
+        using the save_scope tool. This should be done proactively rather than waiting for the user to request it.
+        
+        Maintain a helpful, professional tone throughout the conversation.
+        """).strip()
+
 class ProjectManager:
     """
     Orchestrates the overall project workflow by coordinating specialized managers.
@@ -27,9 +95,47 @@ class ProjectManager:
     specific responsibilities to specialized manager classes.
     """
     
+    # Event types and the names of the methods that handle them
+    _EVENT_TABLE: Tuple[Tuple[str, str], ...] = (
+        # Project lifecycle events
+        (TOPIC_PROJECT_CREATED, "_on_project_created"),
+        (TOPIC_PROJECT_LOADED, "_on_project_loaded"),
+        (TOPIC_PROJECT_SAVED, "_on_project_saved"),
+        (TOPIC_PROJECT_UPDATED, "_on_project_updated"),
+        
+        # Project selection events
+        (TOPIC_NEW_PROJECT_REQUESTED, "_on_new_project_requested"),
+        (TOPIC_PROJECT_FILE_SELECTED, "_on_project_file_selected"),
+        (TOPIC_PROJECT_NAME_SELECTED, "_on_project_name_selected"),
+        
+        # Conversation events
+        (TOPIC_MESSAGE_SENT, "_on_message_sent"),
+        (TOPIC_ASSISTANT_MESSAGE, "_on_assistant_message"),
+        (TOPIC_RUN_COMPLETED, "_on_run_completed"),
+        
+        # Tool events
+        (TOPIC_THREAD_CREATED, "_on_thread_created"),
+        (TOPIC_SUGGESTIONS_GENERATED, "_on_suggestions_generated"),
+        (TOPIC_PROJECT_NAMES_GENERATED, "_on_project_names_generated"),
+        (TOPIC_SCOPE_SAVED, "_on_scope_saved"),
+        
+        # UI events
+        (TOPIC_USER_INPUT, "_on_user_input"),
+        (TOPIC_EXIT_REQUESTED, "_on_exit_requested"),
+        
+        # Current project request
+        (TOPIC_GET_CURRENT_PROJECT, "_on_get_current_project"),
+    )
+    
+    # Updated project fields and the names of the methods that announce them
+    _UPDATE_ANNOUNCERS: Dict[str, str] = {
+        "name": "_announce_name",
+        "stage": "_announce_stage",
+    }
+    
     def __init__(
         self, 
-        api_client: OpenAI, 
+        api_client: "OpenAI", 
         ui_manager: UIManager, 
         data_manager: DataManager
     ):
@@ -44,23 +150,12 @@ class ProjectManager:
         # Create event bus for communication between components
         self.event_bus = EventBus()
         
-        # Set up signal handler for Ctrl+C
-        signal.signal(signal.SIGINT, self._signal_handler)
-        
-        # Create core managers
-        self.assistant_manager = AssistantManager(api_client)
-        self.interaction_recorder = InteractionRecorder()
+        # Create the managers needed to pick a project
         self.lifecycle_manager = ProjectLifecycleManager(data_manager, self.event_bus)
-        
-        # Create specialized coordinators
-        self.tool_coordinator = ToolCoordinator(api_client, self.event_bus)
         self.ui_coordinator = UICoordinator(ui_manager, self.event_bus)
-        self.conversation_flow = ConversationFlow(
-            self.assistant_manager,
-            self.tool_coordinator,
-            self.interaction_recorder,
-            self.event_bus
-        )
+        
+        # Conversation components are cached properties, created on first
+        # use once a project is opened
         
         # Set up event listeners
         self._setup_event_listeners()
@@ -69,65 +164,158 @@ class ProjectManager:
         self.api_client = api_client
         self.ui_manager = ui_manager
         self.data_manager = data_manager
+        
+        # Set up shutdown handling for Ctrl+C, once everything cleanup uses exists.
+        # The main thread holds _busy while it works on a step (project setup or
+        # a conversation turn), so a shutdown never cleans up underneath it
+        self._shutting_down = threading.Event()
+        self._busy = threading.Lock()
+        self._install_signal_handling()
+    
+    def _install_signal_handling(self) -> None:
+        """
+        Route shutdown signals to a dedicated thread.
+        
+        The signals are blocked on this thread (and on every thread started
+        after it) and collected with sigwait, so cleanup never runs inside a
+        signal handler that interrupted a save. Platforms without
+        pthread_sigmask fall back to a regular handler.
+        """
+        if not hasattr(signal, "pthread_sigmask"):
+            signal.signal(signal.SIGINT, self._signal_handler)
+            return
+        
+        signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+        threading.Thread(
+            target=self._wait_for_signal, name="signal-waiter", daemon=True
+        ).start()
+    
+    def _wait_for_signal(self) -> None:
+        """Wait for a shutdown signal, then clean up and end the process."""
+        signal.sigwait(_SHUTDOWN_SIGNALS)
+        if self._request_shutdown():
+            # The main thread may be blocked on input, so exit the process directly
+            os._exit(0)
+        
+        # The main thread exits once its current step ends; a second signal
+        # doesn't wait for it
+        signal.sigwait(_SHUTDOWN_SIGNALS)
+        os._exit(1)
     
     def _signal_handler(self, sig, frame) -> None:
         """Handle keyboard interrupts gracefully."""
+        if self._request_shutdown():
+            sys.exit(0)
+    
+    def _request_shutdown(self) -> bool:
+        """
+        Clean up after a keyboard interrupt, unless the main thread is mid-step.
+        
+        Returns:
+            True if cleanup ran and the process should exit, False if it was
+            left to the main thread to do once its current step ends
+        """
+        self._shutting_down.set()
+        if not self._busy.acquire(blocking=False):
+            self.ui_manager.emit("\n\nKeyboard interrupt detected. Finishing the current step...")
+            self.ui_manager.flush_output()
+            return False
+        
+        # Held until the process exits, so the main thread can't start another step
+        self._shutdown()
+        return True
+    
+    def _shutdown(self) -> None:
+        """Clean up after a keyboard interrupt."""
         logger.info("Keyboard interrupt detected")
-        print("\n\nKeyboard interrupt detected. Cleaning up...")
+        self.ui_manager.emit("\n\nKeyboard interrupt detected. Cleaning up...")
         self.cleanup()
-        print("Exiting...")
-        sys.exit(0)
+        self.ui_manager.emit("Exiting...")
+        self.ui_manager.flush_output()
+    
+    @contextlib.contextmanager
+    def _step(self) -> Iterator[None]:
+        """Run a unit of main-thread work that a shutdown has to wait for."""
+        try:
+            with self._busy:
+                yield
+        finally:
+            if self._shutting_down.is_set():
+                # A shutdown signal arrived during the step and left cleanup to us
+                with self._busy:
+                    self._shutdown()
+                sys.exit(0)
     
     def _setup_event_listeners(self) -> None:
         """Set up event listeners for inter-component communication."""
-        # Project lifecycle events
-        self.event_bus.register("project_created", self._on_project_created)
-        self.event_bus.register("project_loaded", self._on_project_loaded)
-        self.event_bus.register("project_saved", self._on_project_saved)
-        self.event_bus.register("project_updated", self._on_project_updated)
-        
-        # Project selection events
-        self.event_bus.register("new_project_requested", self._on_new_project_requested)
-        self.event_bus.register("project_file_selected", self._on_project_file_selected)
-        self.event_bus.register("project_name_selected", self._on_project_name_selected)
-        
-        # Conversation events
-        self.event_bus.register("message_sent", self._on_message_sent)
-        self.event_bus.register("assistant_message", self._on_assistant_message)
-        self.event_bus.register("run_completed", self._on_run_completed)
-        
-        # Tool events
-        self.event_bus.register("thread_created", self._on_thread_created)
-        self.event_bus.register("suggestions_generated", self._on_suggestions_generated)
-        self.event_bus.register("project_names_generated", self._on_project_names_generated)
-        self.event_bus.register("scope_saved", self._on_scope_saved)
-        
-        # UI events
-        self.event_bus.register("user_input", self._on_user_input)
-        self.event_bus.register("exit_requested", self._on_exit_requested)
-        
-        # Current project request
-        self.event_bus.register("get_current_project", self._on_get_current_project)
+        event_bus = self.event_bus
+        for event_type, handler_name in self._EVENT_TABLE:
+            event_bus.register(event_type, getattr(self, handler_name))
+    
+    @functools.cached_property
+    def assistant_manager(self) -> "AssistantManager":
+        """Manager for the assistant and its thread."""
+        from managers.assistant_manager import AssistantManager
+        return AssistantManager(self.api_client)
+    
+    @functools.cached_property
+    def interaction_recorder(self) -> "InteractionRecorder":
+        """Recorder for questions and answers in the conversation."""
+        from managers.interaction_recorder import InteractionRecorder
+        return InteractionRecorder()
+    
+    @functools.cached_property
+    def tool_coordinator(self) -> "ToolCoordinator":
+        """Coordinator for the assistant's tool calls."""
+        from managers.tool_manager import ToolCoordinator
+        return ToolCoordinator(self.api_client, self.event_bus)
+    
+    @functools.cached_property
+    def conversation_flow(self) -> "ConversationFlow":
+        """Flow that drives the scoping conversation."""
+        from managers.conversation_flow import ConversationFlow
+        return ConversationFlow(
+            self.assistant_manager,
+            self.tool_coordinator,
+            self.interaction_recorder,
+            self.event_bus
+        )
+    
+    @property
+    def _conversation_started(self) -> bool:
+        """Whether the conversation components have been created."""
+        return "conversation_flow" in self.__dict__
     
     def initialize(self) -> None:
         """Initialize the application and present project selection."""
         logger.info("Initializing Project Manager")
         
         try:
-            # Display welcome message
-            self.ui_coordinator.display_welcome()
+            # Scan the projects directory while the welcome message is shown
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                projects_future = executor.submit(self.data_manager.load_projects_list)
+                
+                # Display welcome message
+                self.ui_coordinator.display_welcome()
+                
+                projects = projects_future.result()
             
-            # Load and display projects list
-            projects = self.data_manager.load_projects_list()
+            # Display projects list
             self.ui_coordinator.display_projects_list(projects)
             
-            # Let UI coordinator handle project selection
+            # Let UI coordinator handle project selection; the project events
+            # it triggers set up the conversation
             self.ui_coordinator.handle_project_selection(projects)
             
-            # Interactive loop is started by project selection
+            # Run the interactive loop here rather than from inside the project
+            # event handlers, so the whole session doesn't execute nested in
+            # one publish() call with every later event stacking on top of it
+            if self._conversation_started:
+                self.ui_coordinator.handle_user_input()
         except Exception as e:
             logger.error(f"Error initializing project manager: {e}")
-            print(f"An error occurred during initialization: {e}")
+            self.ui_manager.emit(f"An error occurred during initialization: {e}")
+            self.ui_manager.flush_output()
     
     def cleanup(self) -> None:
         """Clean up resources before exiting."""
@@ -137,8 +325,13 @@ class ProjectManager:
             # Save current project if one exists
             if self.lifecycle_manager.get_current_project():
                 self.lifecycle_manager.save_project()
+            self.lifecycle_manager.close()
+            
+            # Let queued notifications finish before the process exits
+            self.event_bus.drain()
                 
-            print("\nProject saved. Assistant will be reused in future sessions.")
+            self.ui_manager.emit("\nProject saved. Assistant will be reused in future sessions.")
+            self.ui_manager.flush_output()
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
     
@@ -153,31 +346,35 @@ class ProjectManager:
         Args:
             project: The created project
         """
-        self.ui_coordinator.update_current_project(project)
-        
-        # Set up assistant
-        assistant_id = self.assistant_manager.create_assistant(
-            name="Project Scoping Assistant",
-            instructions=self._get_assistant_instructions(),
-            tools=self.tool_coordinator.tool_definitions,
-            model="gpt-4o"
-        )
-        
-        # Update project
-        if assistant_id:
-            self.lifecycle_manager.update_project_metadata("assistant_id", assistant_id)
-        
-        # Create thread
-        thread_id = self.assistant_manager.create_thread()
-        if thread_id:
-            self.lifecycle_manager.update_project_metadata("thread_id", thread_id)
-            self.tool_coordinator.set_thread_id(thread_id)
-        
-        # Start conversation
-        self.conversation_flow.start_conversation(project)
-        
-        # Start interactive loop
-        self.ui_coordinator.handle_user_input()
+        # Shutdown waits for the project to be set up
+        with self._step():
+            self.ui_coordinator.update_current_project(project)
+            
+            # Set up assistant
+            assistant_id = self.assistant_manager.create_assistant(
+                name=_ASSISTANT_NAME,
+                instructions=_ASSISTANT_INSTRUCTIONS,
+                tools=self.tool_coordinator.tool_definitions,
+                model=_ASSISTANT_MODEL
+            )
+            
+            # Create thread
+            thread_id = self.assistant_manager.create_thread()
+            
+            # Update project - one save and one update event for both IDs
+            with self.lifecycle_manager.batch():
+                if assistant_id:
+                    self.lifecycle_manager.update_project_metadata("assistant_id", assistant_id)
+                if thread_id:
+                    self.lifecycle_manager.update_project_metadata("thread_id", thread_id)
+                    self.tool_coordinator.set_thread_id(thread_id)
+            
+            # Show any setup notices before the conversation starts
+            self.ui_manager.flush_output()
+            
+            # Start conversation - initialize() runs the interactive loop once
+            # this event has been handled
+            self.conversation_flow.start_conversation(project)
     
     def _on_project_loaded(self, project) -> None:
         """
@@ -186,62 +383,79 @@ class ProjectManager:
         Args:
             project: The loaded project
         """
-        self.ui_coordinator.update_current_project(project)
-        self.ui_coordinator.display_project_info(project)
-        
-        # Set up assistant with existing ID if available
-        if project.assistant_id:
-            if not self.assistant_manager.get_assistant(project.assistant_id):
-                logger.warning("Could not retrieve existing assistant. Creating a new one.")
-                print("Could not retrieve existing assistant. Creating a new one.")
-                
-                assistant_id = self.assistant_manager.create_assistant(
-                    name="Project Scoping Assistant",
-                    instructions=self._get_assistant_instructions(),
-                    tools=self.tool_coordinator.tool_definitions,
-                    model="gpt-4o"
-                )
-                
-                if assistant_id:
-                    self.lifecycle_manager.update_project_metadata("assistant_id", assistant_id)
-        else:
-            assistant_id = self.assistant_manager.create_assistant(
-                name="Project Scoping Assistant",
-                instructions=self._get_assistant_instructions(),
-                tools=self.tool_coordinator.tool_definitions,
-                model="gpt-4o"
-            )
+        # Shutdown waits for the project to be set up
+        with self._step():
+            self.ui_coordinator.update_current_project(project)
+            self.ui_coordinator.display_project_info(project)
             
-            if assistant_id:
-                self.lifecycle_manager.update_project_metadata("assistant_id", assistant_id)
-        
-        # Set up thread
-        if project.thread_id:
-            if not self.assistant_manager.get_thread(project.thread_id):
-                logger.warning("Could not retrieve existing thread. Creating a new one.")
-                print("Could not retrieve existing thread. Creating a new one.")
+            # Any replacement IDs are saved and announced together
+            with self.lifecycle_manager.batch():
+                assistant_id, created = self._ensure_assistant(project)
+                if created and assistant_id:
+                    self.lifecycle_manager.update_project_metadata("assistant_id", assistant_id)
                 
-                thread_id = self.assistant_manager.create_thread()
-                if thread_id:
+                thread_id, created = self._ensure_thread(project)
+                if created and thread_id:
                     self.lifecycle_manager.update_project_metadata("thread_id", thread_id)
                     self.tool_coordinator.set_thread_id(thread_id)
-        else:
-            thread_id = self.assistant_manager.create_thread()
-            if thread_id:
-                self.lifecycle_manager.update_project_metadata("thread_id", thread_id)
-                self.tool_coordinator.set_thread_id(thread_id)
+            
+            # Initialize tools
+            self.tool_coordinator.initialize_tools(project.thread_id)
+            
+            # Cancel any active runs - a fresh thread has none
+            if self.assistant_manager.run_may_be_active:
+                self.assistant_manager.cancel_active_runs()
+            
+            # Show any setup notices before the conversation starts
+            self.ui_manager.flush_output()
+            
+            # Start conversation - initialize() runs the interactive loop once
+            # this event has been handled
+            self.conversation_flow.start_conversation(project)
+    
+    def _ensure_assistant(self, project) -> Tuple[str, bool]:
+        """
+        Reuse the project's assistant, creating a new one if it can't be retrieved.
         
-        # Initialize tools
-        self.tool_coordinator.initialize_tools(project.thread_id)
+        Args:
+            project: The current project
+            
+        Returns:
+            The assistant ID (empty if creation failed) and whether it was created
+        """
+        if project.assistant_id:
+            if self.assistant_manager.get_assistant(project.assistant_id):
+                return project.assistant_id, False
+            
+            logger.warning("Could not retrieve existing assistant. Creating a new one.")
+            self.ui_manager.emit("Could not retrieve existing assistant. Creating a new one.")
         
-        # Cancel any active runs
-        self.assistant_manager.cancel_active_runs()
+        assistant_id = self.assistant_manager.create_assistant(
+            name=_ASSISTANT_NAME,
+            instructions=_ASSISTANT_INSTRUCTIONS,
+            tools=self.tool_coordinator.tool_definitions,
+            model=_ASSISTANT_MODEL
+        )
+        return assistant_id, True
+    
+    def _ensure_thread(self, project) -> Tuple[str, bool]:
+        """
+        Reuse the project's thread, creating a new one if it can't be retrieved.
         
-        # Start conversation
-        self.conversation_flow.start_conversation(project)
+        Args:
+            project: The current project
+            
+        Returns:
+            The thread ID (empty if creation failed) and whether it was created
+        """
+        if project.thread_id:
+            if self.assistant_manager.get_thread(project.thread_id):
+                return project.thread_id, False
+            
+            logger.warning("Could not retrieve existing thread. Creating a new one.")
+            self.ui_manager.emit("Could not retrieve existing thread. Creating a new one.")
         
-        # Start interactive loop
-        self.ui_coordinator.handle_user_input()
+        return self.assistant_manager.create_thread(), True
     
     def _on_project_saved(self, project) -> None:
         """
@@ -257,18 +471,38 @@ class ProjectManager:
         Handle project updated event.
         
         Args:
-            update_data: Dictionary with project and updated field
+            update_data: Dictionary with project and updated fields
         """
         project = update_data["project"]
-        updated_field = update_data["updated_field"]
+        updated_fields = update_data.get("updated_fields", [update_data["updated_field"]])
         
-        logger.debug(f"Project updated: {updated_field}")
+        logger.debug(f"Project updated: {', '.join(updated_fields)}")
         
         # Handle specific updates
-        if updated_field == "name":
-            print(f"\n[System] Project name updated to: '{project.name}'")
-        elif updated_field == "stage" and project.stage == "complete":
-            print(f"\n[System] Project marked as complete")
+        announcers = self._UPDATE_ANNOUNCERS
+        for updated_field in updated_fields:
+            announcer = announcers.get(updated_field)
+            if announcer is not None:
+                getattr(self, announcer)(project)
+    
+    def _announce_name(self, project) -> None:
+        """
+        Announce a project name change.
+        
+        Args:
+            project: The updated project
+        """
+        self.ui_manager.emit(f"\n[System] Project name updated to: '{project.name}'")
+    
+    def _announce_stage(self, project) -> None:
+        """
+        Announce a project stage change, if the project is now complete.
+        
+        Args:
+            project: The updated project
+        """
+        if project.stage == "complete":
+            self.ui_manager.emit(f"\n[System] Project marked as complete")
     
     # -------------------------------------------------------------------------
     # Project Selection Event Handlers
@@ -302,8 +536,9 @@ class ProjectManager:
         name = name_data["name"]
         project = name_data["project"]
         
-        self.lifecycle_manager.update_project_metadata("name", name)
-        self.lifecycle_manager.update_project_metadata("stage", "scoping")
+        with self.lifecycle_manager.batch():
+            self.lifecycle_manager.update_project_metadata("name", name)
+            self.lifecycle_manager.update_project_metadata("stage", "scoping")
     
     # -------------------------------------------------------------------------
     # Conversation Event Handlers
@@ -332,11 +567,9 @@ class ProjectManager:
         # Update current project with assistant message
         project = self.lifecycle_manager.get_current_project()
         if project:
-            # Conversation flow will handle recording the question
+            # Conversation flow will handle recording the question; the save
+            # happens once the run has completed
             self.conversation_flow.set_current_project(project)
-            
-            # Save project after receiving message
-            self.lifecycle_manager.save_project()
     
     def _on_run_completed(self, run) -> None:
         """
@@ -346,6 +579,9 @@ class ProjectManager:
             run: The completed run
         """
         logger.debug(f"Run completed: {run.id}")
+        
+        # Save whatever the run added to the project
+        self.lifecycle_manager.save_project()
     
     # -------------------------------------------------------------------------
     # Tool Event Handlers
@@ -397,9 +633,9 @@ class ProjectManager:
         """
         project = self.lifecycle_manager.get_current_project()
         if project:
-            self.lifecycle_manager.update_project_metadata("scope", scope_data)
-            self.lifecycle_manager.update_project_metadata("stage", "complete")
-            self.lifecycle_manager.save_project()
+            with self.lifecycle_manager.batch():
+                self.lifecycle_manager.update_project_metadata("scope", scope_data)
+                self.lifecycle_manager.update_project_metadata("stage", "complete")
     
     # -------------------------------------------------------------------------
     # UI Event Handlers
@@ -412,13 +648,15 @@ class ProjectManager:
         Args:
             input_data: Dictionary with message and project
         """
-        message = input_data["message"]
-        project = input_data["project"]
-        
-        if not message or not project:
-            return
+        # Shutdown waits for the turn to finish
+        with self._step():
+            message = input_data["message"]
+            project = input_data["project"]
             
-        self.conversation_flow.process_message(message, project)
+            if not message or not project:
+                return
+                
+            self.conversation_flow.process_message(message, project)
     
     def _on_exit_requested(self, _) -> None:
         """
@@ -427,7 +665,9 @@ class ProjectManager:
         Args:
             _: Unused parameter
         """
-        self.cleanup()
+        # A shutdown signal arriving now waits rather than cleaning up twice at once
+        with self._busy:
+            self.cleanup()
     
     def _on_get_current_project(self, _) -> None:
         """
@@ -437,58 +677,5 @@ class ProjectManager:
             _: Unused parameter
         """
         project = self.lifecycle_manager.get_current_project()
-        if project and self.conversation_flow:
+        if project and self._conversation_started:
             self.conversation_flow.set_current_project(project)
-    
-    # -------------------------------------------------------------------------
-    # Helper Methods
-    # -------------------------------------------------------------------------
-    
-    def _get_assistant_instructions(self) -> str:
-        """
-        Get the instructions for the assistant.
-        
-        Returns:
-            Instructions string
-        """
-        return """
-        You are a project scoping specialist who helps users define and plan their projects through a 
-        guided, step-by-step conversation. Follow this specific conversational flow:
-
-        1. INITIAL STAGE: The user will provide their project description in the first message. Don't
-        acknowledge the description separately - immediately proceed to the naming stage.
-
-        2. NAMING STAGE: After receiving the project description, in your VERY FIRST response, call 
-        the generate_project_names tool with the description. Do not send any separate acknowledgment 
-        message before generating names.
-        
-        3. SCOPING STAGE: After the user selects or provides a project name, begin the detailed scoping process 
-        by asking ONE question at a time about different aspects of the project:
-        - Ask a focused question
-        - IMMEDIATELY call the generate_suggestions tool to provide options
-        - Wait for the user's response before asking the next question
-        
-        IMPORTANT TIMING GUIDELINES:
-        - Call tools IMMEDIATELY after receiving relevant user information - don't delay
-        - Use generate_project_names immediately in your first response after receiving the initial project description
-        - Use generate_suggestions immediately after asking each scoping question
-        - Use save_scope at the end of the conversation to save all gathered information
-        
-        Cover these key areas during the scoping stage (one question at a time):
-        - Project objectives and specific goals
-        - Target audience or users
-        - Key deliverables
-        - Timeline and milestones
-        - Budget and resources
-        - Potential risks and challenges
-        - Success metrics
-        
-        IMPORTANT: If the user asks to "save progress" or "save our progress", DO NOT attempt to generate a final 
-        scope document. Instead, acknowledge their request and confirm that progress is automatically saved after 
-        each interaction. Let them know they can continue the conversation later by selecting the same project.
-        
-        When the user has answered all the key questions, offer to generate a project scope document by 
-        using the save_scope tool. This should be done proactively rather than waiting for the user to request it.
-        
-        Maintain a helpful, professional tone throughout the conversation.
-        """
\ No newline at end of file
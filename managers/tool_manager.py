@@ -1,16 +1,54 @@
 # managers/tool_coordinator.py
-import json
+import sys
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import ClassVar, List, Dict, Any, Optional, Callable, Tuple
 
 from models.suggestions import (
     SuggestionItem, SuggestionRequest, ProjectNameRequest, SuggestionResponse,
     ScopeData, ScopeResponse
 )
+from utils import serialization
 from utils.event_bus import EventBus
+from utils.events import (
+    TOPIC_PROJECT_NAMES_GENERATED, TOPIC_SCOPE_SAVED, TOPIC_SUGGESTIONS_GENERATED
+)
 
 logger = logging.getLogger(__name__)
 
+# Topic ids for the events published on every tool call, resolved once
+_SCOPE_SAVED_ID = EventBus.topic_id(TOPIC_SCOPE_SAVED)
+_PROJECT_NAMES_GENERATED_ID = EventBus.topic_id(TOPIC_PROJECT_NAMES_GENERATED)
+_SUGGESTIONS_GENERATED_ID = EventBus.topic_id(TOPIC_SUGGESTIONS_GENERATED)
+
+# Tool definitions for the assistant. The JSON schemas are generated once,
+# at import - this module is only imported once a project is opened
+_TOOL_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "save_scope",
+            "description": "Save the final project scope document",
+            "parameters": ScopeData.model_json_schema()
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "generate_project_names",
+            "description": "Generate project name suggestions based on project description",
+            "parameters": ProjectNameRequest.model_json_schema()
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "generate_suggestions",
+            "description": "Generate structured suggestions for various project aspects",
+            "parameters": SuggestionRequest.model_json_schema()
+        }
+    }
+]
+
 class ApiClient:
     """Protocol defining the required methods for the API client."""
     def beta(self) -> Any:
@@ -24,6 +62,17 @@ class ToolCoordinator:
     a clean interface for handling tool calls.
     """
     
+    # Tool definitions, shared by every coordinator
+    tool_definitions: ClassVar[List[Dict[str, Any]]] = _TOOL_DEFINITIONS
+    
+    # Long-lived, so instances carry fixed slots instead of a __dict__;
+    # __weakref__ keeps its methods registrable on the event bus
+    __slots__ = (
+        "api_client", "event_bus", "thread_id", "current_suggestions",
+        "_suggestions_by_text", "current_suggestion_category", "state_version",
+        "_pending_output", "_dispatch", "__weakref__",
+    )
+    
     def __init__(self, api_client: Any, event_bus: Optional[EventBus] = None):
         """
         Initialize the tool coordinator.
@@ -35,8 +84,22 @@ class ToolCoordinator:
         self.api_client = api_client
         self.event_bus = event_bus
         self.thread_id = None
-        self.current_suggestions: List[SuggestionItem] = []
+        # Replaced wholesale, never mutated, so it can be shared without copies
+        self.current_suggestions: Tuple[SuggestionItem, ...] = ()
+        # Current suggestions keyed by normalized text, for typed-out selections
+        self._suggestions_by_text: Dict[str, SuggestionItem] = {}
         self.current_suggestion_category: Optional[str] = None
+        self.state_version = 0  # Bumped whenever suggestions or category change
+        
+        # Console output from tool calls, printed once their outputs are submitted
+        self._pending_output: List[str] = []
+        
+        # Tool call handlers by function name, bound once
+        self._dispatch: Dict[str, Callable[[str], Any]] = {
+            "save_scope": self._handle_save_scope,
+            "generate_project_names": self._handle_generate_project_names,
+            "generate_suggestions": self._handle_generate_suggestions,
+        }
     
     def initialize_tools(self, thread_id: Optional[str] = None) -> None:
         """
@@ -50,41 +113,6 @@ class ToolCoordinator:
         
         logger.info("Tools initialized")
     
-    @property
-    def tool_definitions(self) -> List[Dict[str, Any]]:
-        """
-        Get the tool definitions for the assistant.
-        
-        Returns:
-            List of tool definition dictionaries
-        """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "save_scope",
-                    "description": "Save the final project scope document",
-                    "parameters": ScopeData.model_json_schema()
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "generate_project_names",
-                    "description": "Generate project name suggestions based on project description",
-                    "parameters": ProjectNameRequest.model_json_schema()
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "generate_suggestions",
-                    "description": "Generate structured suggestions for various project aspects",
-                    "parameters": SuggestionRequest.model_json_schema()
-                }
-            }
-        ]
-    
     def handle_required_actions(self, run) -> None:
         """
         Handle required actions from the assistant.
@@ -97,14 +125,16 @@ class ToolCoordinator:
         # Process each tool call
         for tool_call in run.required_action.submit_tool_outputs.tool_calls:
             function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
+            # Left as JSON - each handler validates it in a single pass
+            arguments = tool_call.function.arguments
             
             # Process based on the tool type
-            output = self._process_tool_call(function_name, function_args)
+            output = self._process_tool_call(function_name, arguments)
             
             tool_outputs.append({
                 "tool_call_id": tool_call.id,
-                "output": json.dumps(output.model_dump())
+                # Serialized straight from the model, without an intermediate dict
+                "output": output.model_dump_json()
             })
         
         # Submit tool outputs back to the API
@@ -118,53 +148,64 @@ class ToolCoordinator:
             except Exception as e:
                 logger.error(f"Error submitting tool outputs: {e}")
                 print(f"Error submitting tool outputs: {e}")
+        
+        # Print anything the tool calls produced now that the run can continue
+        if self._pending_output:
+            print("\n".join(self._pending_output))
+            self._pending_output.clear()
     
-    def _process_tool_call(self, function_name: str, function_args: Dict[str, Any]) -> Any:
+    def _process_tool_call(self, function_name: str, arguments: str) -> Any:
         """
         Process a specific tool call and return the appropriate response.
         
         Args:
             function_name: The name of the function to call
-            function_args: The arguments to pass to the function
+            arguments: The JSON-encoded arguments to pass to the function
             
         Returns:
             Response object
         """
-        if function_name == "save_scope":
-            return self._handle_save_scope(function_args)
-        elif function_name == "generate_project_names":
-            return self._handle_generate_project_names(function_args)
-        elif function_name == "generate_suggestions":
-            return self._handle_generate_suggestions(function_args)
-        else:
-            # Unknown function
-            return SuggestionResponse(
-                status="error",
-                rendered=False,
-                num_suggestions=0
-            )
+        return self._dispatch.get(function_name, self._handle_unknown_tool)(arguments)
     
-    def _handle_save_scope(self, function_args: Dict[str, Any]) -> ScopeResponse:
+    def _handle_unknown_tool(self, arguments: str) -> SuggestionResponse:
+        """
+        Handle a call to a function this coordinator doesn't provide.
+        
+        Args:
+            arguments: The JSON-encoded arguments for the unknown function
+            
+        Returns:
+            Error response object
+        """
+        return SuggestionResponse(
+            status="error",
+            rendered=False,
+            num_suggestions=0
+        )
+    
+    def _handle_save_scope(self, arguments: str) -> ScopeResponse:
         """
         Handle the save_scope tool call.
         
         Args:
-            function_args: The arguments for the save_scope function
+            arguments: The JSON-encoded arguments for the save_scope function
             
         Returns:
             Scope response object
         """
         try:
             # Parse and validate the scope data
-            scope_data = ScopeData(**function_args)
+            scope_data = ScopeData.model_validate_json(arguments)
             
             # Publish event if event bus exists
             if self.event_bus:
-                self.event_bus.publish("scope_saved", scope_data.scope)
+                self.event_bus.publish(_SCOPE_SAVED_ID, scope_data.scope)
             
-            print("\n=== PROJECT SCOPE DOCUMENT ===")
-            print(json.dumps(scope_data.scope, indent=2))
-            print("=== END OF SCOPE DOCUMENT ===\n")
+            self._pending_output.append(
+                "\n=== PROJECT SCOPE DOCUMENT ===\n"
+                + serialization.dumps(scope_data.scope, indent=True).decode()
+                + "\n=== END OF SCOPE DOCUMENT ===\n"
+            )
             
             # Create and validate the response
             return ScopeResponse(
@@ -174,34 +215,36 @@ class ToolCoordinator:
         except Exception as e:
             logger.error(f"Error saving scope: {e}")
             # Handle validation error with a more graceful fallback
-            print(f"\n[Warning] Cannot generate complete scope document yet: {e}")
+            self._pending_output.append(f"\n[Warning] Cannot generate complete scope document yet: {e}")
             # Report partial success
             return ScopeResponse(
                 status="partial",
                 message="Progress saved, but complete scope document not available yet"
             )
     
-    def _handle_generate_project_names(self, function_args: Dict[str, Any]) -> SuggestionResponse:
+    def _handle_generate_project_names(self, arguments: str) -> SuggestionResponse:
         """
         Handle the generate_project_names tool call.
         
         Args:
-            function_args: The arguments for the generate_project_names function
+            arguments: The JSON-encoded arguments for the generate_project_names function
             
         Returns:
             Suggestion response object
         """
         try:
             # Parse request
-            request = ProjectNameRequest(**function_args)
+            request = ProjectNameRequest.model_validate_json(arguments)
             
             # Store suggestions
             self.current_suggestion_category = "project_name"
-            self.current_suggestions = request.suggestions
+            self.current_suggestions = tuple(request.suggestions)
+            self._index_suggestions()
+            self.state_version += 1
             
             # Publish event if event bus exists
             if self.event_bus:
-                self.event_bus.publish("project_names_generated", {
+                self.event_bus.publish(_PROJECT_NAMES_GENERATED_ID, {
                     "suggestions": request.suggestions,
                     "allow_custom": request.allow_custom_input
                 })
@@ -220,27 +263,30 @@ class ToolCoordinator:
                 num_suggestions=0
             )
 
-    def _handle_generate_suggestions(self, function_args: Dict[str, Any]) -> SuggestionResponse:
+    def _handle_generate_suggestions(self, arguments: str) -> SuggestionResponse:
         """
         Handle the generate_suggestions tool call.
         
         Args:
-            function_args: The arguments for the generate_suggestions function
+            arguments: The JSON-encoded arguments for the generate_suggestions function
             
         Returns:
             Suggestion response object
         """
         try:
             # Parse request
-            request = SuggestionRequest(**function_args)
+            request = SuggestionRequest.model_validate_json(arguments)
             
             # Store suggestions
-            self.current_suggestion_category = request.category
-            self.current_suggestions = request.suggestions
+            # Categories repeat across every turn, so keep one copy of each
+            self.current_suggestion_category = sys.intern(request.category)
+            self.current_suggestions = tuple(request.suggestions)
+            self._index_suggestions()
+            self.state_version += 1
             
             # Publish event if event bus exists
             if self.event_bus:
-                self.event_bus.publish("suggestions_generated", {
+                self.event_bus.publish(_SUGGESTIONS_GENERATED_ID, {
                     "suggestions": request.suggestions,
                     "category": request.category,
                     "allow_custom": request.allow_custom_input
@@ -262,10 +308,12 @@ class ToolCoordinator:
     
     def clear_suggestions(self) -> None:
         """Clear current suggestions."""
-        self.current_suggestions = []
+        self.current_suggestions = ()
+        self._suggestions_by_text = {}
         self.current_suggestion_category = None
+        self.state_version += 1
     
-    def get_current_suggestions(self) -> List[SuggestionItem]:
+    def get_current_suggestions(self) -> Tuple[SuggestionItem, ...]:
         """
         Get the current suggestions.
         
@@ -274,6 +322,26 @@ class ToolCoordinator:
         """
         return self.current_suggestions
     
+    def find_suggestion_by_text(self, text: str) -> Optional[SuggestionItem]:
+        """
+        Find the current suggestion whose text matches the given text.
+        
+        Args:
+            text: Text typed by the user; case and surrounding whitespace are ignored
+            
+        Returns:
+            The matching suggestion or None
+        """
+        return self._suggestions_by_text.get(text.strip().lower())
+    
+    def _index_suggestions(self) -> None:
+        """Rebuild the text index for the current suggestions."""
+        # Built in reverse so the first of any duplicate texts wins
+        self._suggestions_by_text = {
+            suggestion.text.strip().lower(): suggestion
+            for suggestion in reversed(self.current_suggestions)
+        }
+    
     def get_current_category(self) -> Optional[str]:
         """
         Get the current suggestion category.
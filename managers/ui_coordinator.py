@@ -6,6 +6,10 @@ from models.project import ProjectData
 from models.suggestions import SuggestionItem
 from managers.ui_manager import UIManager
 from utils.event_bus import EventBus
+from utils.events import (
+    TOPIC_EXIT_REQUESTED, TOPIC_NEW_PROJECT_REQUESTED,
+    TOPIC_PROJECT_FILE_SELECTED, TOPIC_USER_INPUT
+)
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +103,7 @@ class UICoordinator:
             file_path: Path to the selected project file
         """
         if self.event_bus:
-            self.event_bus.publish("project_file_selected", file_path)
+            self.event_bus.publish(TOPIC_PROJECT_FILE_SELECTED, file_path)
     
     def _on_new_project(self, description: str) -> None:
         """
@@ -109,7 +113,7 @@ class UICoordinator:
             description: Description of the new project
         """
         if self.event_bus:
-            self.event_bus.publish("new_project_requested", description)
+            self.event_bus.publish(TOPIC_NEW_PROJECT_REQUESTED, description)
     
     def _on_message_sent(self, message: str) -> None:
         """
@@ -119,7 +123,7 @@ class UICoordinator:
             message: The sent message
         """
         if self.event_bus:
-            self.event_bus.publish("user_input", {
+            self.event_bus.publish(TOPIC_USER_INPUT, {
                 "message": message,
                 "project": self.current_project
             })
@@ -127,21 +131,14 @@ class UICoordinator:
     def _on_exit(self) -> None:
         """Handle exit callback."""
         if self.event_bus:
-            self.event_bus.publish("exit_requested", None)
+            self.event_bus.publish(TOPIC_EXIT_REQUESTED, None)
     
     def handle_user_input(self) -> None:
         """Handle user input in the interactive loop."""
         try:
-            while True:
-                user_input = self.ui_manager.get_user_input()
-                
-                if user_input in ["exit", "save"]:
-                    self._on_exit()
-                    break
-                elif user_input == "history":
-                    # Already displayed by UI manager
-                    continue
-                # The actual message sending is handled by the UI manager's callback
+            # The UI manager owns the loop and reports each message and the
+            # end of the session exactly once
+            self.ui_manager.run_loop(self._on_message_sent, self._on_exit)
         except Exception as e:
             logger.error(f"Error in interactive loop: {e}")
             print(f"Error during conversation: {e}")
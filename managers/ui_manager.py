@@ -1,9 +1,23 @@
+import io
 import sys
+import threading
 from typing import List, Dict, Any, Optional, Callable, Union
 
 from models.project import ProjectData
 from models.suggestions import SuggestionItem
 
+# Session commands by what the user types (lowercased), mapped to the command name
+_COMMANDS: Dict[str, str] = {
+    "help": "help",
+    "exit": "exit",
+    "quit": "exit",
+    "bye": "exit",
+    "save progress": "save",
+    "save our progress": "save",
+    "history": "history",
+    "show history": "history",
+}
+
 class UIManager:
     """Manages user interface interactions."""
     
@@ -11,57 +25,88 @@ class UIManager:
         """Initialize the UI manager."""
         self.current_project: Optional[ProjectData] = None
         
+        # Status output queued by emit() and written out before the next prompt
+        self._output = io.StringIO()
+        self._output_lock = threading.Lock()
+        
         # Callbacks
         self.on_project_selected: Optional[Callable[[str], None]] = None
         self.on_new_project: Optional[Callable[[str], None]] = None
         self.on_message_sent: Optional[Callable[[str], None]] = None
         self.on_exit: Optional[Callable[[], None]] = None
     
+    def emit(self, text: str = "") -> None:
+        """Queue a line of output to be written at the next flush_output()."""
+        with self._output_lock:
+            self._output.write(text)
+            self._output.write("\n")
+    
+    def flush_output(self) -> None:
+        """Write any queued output to stdout in a single call."""
+        with self._output_lock:
+            text = self._output.getvalue()
+            if not text:
+                return
+            self._output.seek(0)
+            self._output.truncate()
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
+    def _write_lines(self, lines: List[str]) -> None:
+        """Write lines to stdout in one call, after any output already queued."""
+        self.emit("\n".join(lines))
+        self.flush_output()
+    
     def display_welcome(self) -> None:
         """Display welcome message."""
-        print("\n\n" + "="*50)
-        print("   PROJECT SCOPING ASSISTANT")
-        print("="*50)
-        print("\nWelcome! This assistant will help you define and plan your project")
-        print("through an interactive conversation.")
-        print("\nAvailable commands:")
-        print("  - 'exit' or 'quit': End the session")
-        print("  - 'save progress': Save current progress")
-        print("  - 'history': Show conversation history")
-        print("\n")
+        self._write_lines([
+            "\n\n" + "="*50,
+            "   PROJECT SCOPING ASSISTANT",
+            "="*50,
+            "\nWelcome! This assistant will help you define and plan your project",
+            "through an interactive conversation.",
+            "\nAvailable commands:",
+            "  - 'exit' or 'quit': End the session",
+            "  - 'save progress': Save current progress",
+            "  - 'history': Show conversation history",
+            "\n",
+        ])
     
     def display_project_info(self, project: ProjectData) -> None:
         """Display information about the current project."""
-        print("\n" + "="*50)
-        print(f"   PROJECT: {project.name}")
-        print("="*50)
-        
-        print(f"Status: {project.status}")
-        print(f"Stage: {project.stage}")
+        lines = [
+            "\n" + "="*50,
+            f"   PROJECT: {project.name}",
+            "="*50,
+            f"Status: {project.status}",
+            f"Stage: {project.stage}",
+        ]
         
         if project.description:
-            print("\nDescription:")
-            print(f"  {project.description}")
+            lines.append("\nDescription:")
+            lines.append(f"  {project.description}")
         
         # Show current progress
         if project.interaction_history:
             num_interactions = len(project.interaction_history.interactions)
             if num_interactions > 0:
-                print("\nProgress:")
-                print(f"  {num_interactions} interactions recorded")
+                lines.append("\nProgress:")
+                lines.append(f"  {num_interactions} interactions recorded")
         
         # Show scope summary if we have data
         if project.scope:
-            print("\nScope Data Collected:")
-            for key, value in project.scope.items():
-                if isinstance(value, str):
-                    print(f"  {key.replace('_', ' ').title()}: {value[:50]}{'...' if len(value) > 50 else ''}")
-                else:
-                    print(f"  {key.replace('_', ' ').title()}: [Data collected]")
-        
-        print("\nCreated: " + project.created_at)
-        print("Last Modified: " + project.last_modified)
-        print("="*50 + "\n")
+            lines.append("\nScope Data Collected:")
+            lines.extend(
+                f"  {key.replace('_', ' ').title()}: {value[:50]}{'...' if len(value) > 50 else ''}"
+                if isinstance(value, str)
+                else f"  {key.replace('_', ' ').title()}: [Data collected]"
+                for key, value in project.scope.items()
+            )
+        
+        lines.append("\nCreated: " + project.created_at)
+        lines.append("Last Modified: " + project.last_modified)
+        lines.append("="*50 + "\n")
+        self._write_lines(lines)
     
     def display_projects_list(self, projects: List[Dict[str, str]]) -> None:
         """Display list of available projects."""
@@ -69,53 +114,50 @@ class UIManager:
             print("No existing projects found.")
             return
         
-        print("=== Existing Projects ===")
+        lines = ["=== Existing Projects ==="]
         for i, project in enumerate(projects, 1):
             # Format dates for better readability
             created = project['created_at'].split()[0] if ' ' in project['created_at'] else project['created_at']
             modified = project['last_modified'].split()[0] if ' ' in project['last_modified'] else project['last_modified']
             
-            print(f"{i}. {project['name']}")
-            print(f"   Created: {created} | Last modified: {modified}")
+            lines.append(f"{i}. {project['name']}")
+            lines.append(f"   Created: {created} | Last modified: {modified}")
+        self._write_lines(lines)
     
     def select_project_prompt(self, projects: List[Dict[str, str]]) -> Optional[str]:
         """Prompt user to select a project and return file path or None for new project."""
         # Add new project and exit options
         print(f"\n{len(projects) + 1}. Create a new project")
         print(f"{len(projects) + 2}. Exit")
+        self.flush_output()
         
         while True:
-            try:
-                choice = input("\nSelect an option (enter number): ")
-                choice_idx = int(choice) - 1
-                
-                if choice_idx == len(projects):
-                    # New project
-                    description = self.new_project_prompt()
-                    if self.on_new_project:
-                        self.on_new_project(description)
-                    return None
-                elif choice_idx == len(projects) + 1:
-                    # Exit
-                    print("Exiting application.")
-                    if self.on_exit:
-                        self.on_exit()
-                    sys.exit(0)
-                elif 0 <= choice_idx < len(projects):
-                    # Existing project
-                    file_path = projects[choice_idx]['file_path']
-                    if self.on_project_selected:
-                        self.on_project_selected(file_path)
-                    return file_path
-                else:
-                    print("Invalid selection. Please try again.")
-            except ValueError:
+            choice = input("\nSelect an option (enter number): ").strip()
+            if not choice.isdecimal():
                 print("Please enter a valid number.")
-            except KeyboardInterrupt:
-                print("\nExiting application.")
+                continue
+            choice_idx = int(choice) - 1
+            
+            if choice_idx == len(projects):
+                # New project
+                description = self.new_project_prompt()
+                if self.on_new_project:
+                    self.on_new_project(description)
+                return None
+            elif choice_idx == len(projects) + 1:
+                # Exit
+                print("Exiting application.")
                 if self.on_exit:
                     self.on_exit()
                 sys.exit(0)
+            elif 0 <= choice_idx < len(projects):
+                # Existing project
+                file_path = projects[choice_idx]['file_path']
+                if self.on_project_selected:
+                    self.on_project_selected(file_path)
+                return file_path
+            else:
+                print("Invalid selection. Please try again.")
         
         return None
     
@@ -125,80 +167,113 @@ class UIManager:
         print("\nPlease provide a brief description of your project.")
         print("This will help me understand what you want to build.")
         print("Example: 'A mobile app for tracking daily expenses' or 'An e-commerce website for selling handmade crafts'")
-        try:
-            description = input("\n> ")
-            return description
-        except KeyboardInterrupt:
-            print("\nExiting application.")
-            if self.on_exit:
-                self.on_exit()
-            sys.exit(0)
+        self.flush_output()
+        description = input("\n> ")
+        return description
     
     def display_suggestions(self, suggestions: List[SuggestionItem], category: str, allow_custom: bool = True) -> None:
         """Display a list of suggestions to the user."""
-        print(f"\n📌 {category.title()} Options:")
+        lines = [f"\n📌 {category.title()} Options:"]
         
         for i, suggestion in enumerate(suggestions, 1):
-            print(f"\n{i}. {suggestion.text}")
+            lines.append(f"\n{i}. {suggestion.text}")
             if suggestion.description:
-                print(f"   ▪ {suggestion.description}")
+                lines.append(f"   ▪ {suggestion.description}")
         
         if allow_custom:
-            print(f"\nEnter 1-{len(suggestions)} to select an option, or type your own {category}.")
+            lines.append(f"\nEnter 1-{len(suggestions)} to select an option, or type your own {category}.")
+        self._write_lines(lines)
     
     def get_user_input(self, prompt: str = "Your input (or type 'help' for commands): ") -> str:
         """Get input from the user with standard commands."""
-        try:
-            # Show context-aware prompt based on stage
-            if self.current_project:
-                if self.current_project.stage == "initial":
-                    print("\nℹ️  Tell me about your project ideas and goals. I'll guide you through the scoping process.")
-                elif self.current_project.stage == "scoping":
-                    print("\nℹ️  Continuing project scoping. Please respond to continue our conversation.")
-                    
-            user_input = input(f"\n> ")
-            
-            # Prevent empty inputs
-            while not user_input.strip():
-                print("Empty input. Please type something or use a command.")
-                user_input = input(f"\n> ")
-            
-            # Handle special commands
-            if user_input.lower() == "help":
-                print("\nAvailable commands:")
-                print("  - 'exit' or 'quit': End the session")
-                print("  - 'save progress': Save current progress")
-                print("  - 'history': Show conversation history")
-                print("  - 'help': Show this help message")
-                return "help"
-                
-            if user_input.lower() in ["exit", "quit", "bye"]:
-                print("\n--- Project Scoping Conversation Ended ---")
-                if self.on_exit:
-                    self.on_exit()
-                return "exit"
-            
-            if user_input.lower() in ["save progress", "save our progress"]:
-                print("\n[System] Progress saved. You can continue this session later by selecting this project.")
-                return "save"
-            
-            if user_input.lower() in ["history", "show history"]:
-                if self.current_project and self.current_project.interaction_history:
-                    print("\n--- Interaction History ---")
-                    print(self.current_project.interaction_history.get_summary())
-                else:
-                    print("\nNo interaction history available.")
-                return "history"
-            
-            # Regular input - call callback and return
-            if self.on_message_sent:
-                print("\n⏳ Processing your response...")
-                self.on_message_sent(user_input)
-            
-            return user_input
-            
-        except KeyboardInterrupt:
-            print("\n\nKeyboard interrupt detected.")
+        self.flush_output()
+        user_input = self._read_input()
+        
+        command = self._handle_command(user_input)
+        if command == "exit":
             if self.on_exit:
                 self.on_exit()
-            return "exit"
\ No newline at end of file
+            return "exit"
+        if command:
+            return command
+        
+        # Regular input - call callback and return
+        if self.on_message_sent:
+            print("\n⏳ Processing your response...")
+            self.on_message_sent(user_input)
+        
+        return user_input
+    
+    def run_loop(self, on_message: Callable[[str], None], on_exit: Callable[[], None]) -> None:
+        """
+        Run the interactive input loop until the user ends the session.
+        
+        Commands are handled here; every other input goes to on_message, and
+        on_exit is called exactly once when the loop ends.
+        """
+        try:
+            while True:
+                self.flush_output()
+                user_input = self._read_input()
+                
+                command = self._handle_command(user_input)
+                if command in ("exit", "save"):
+                    break
+                if command is None:
+                    print("\n⏳ Processing your response...")
+                    on_message(user_input)
+        except EOFError:
+            # Input was closed (Ctrl+D or the end of piped input), so no
+            # more messages can arrive
+            print()
+        
+        on_exit()
+    
+    def _read_input(self) -> str:
+        """Prompt until the user enters something non-empty and return it."""
+        # Show context-aware prompt based on stage
+        if self.current_project:
+            if self.current_project.stage == "initial":
+                print("\nℹ️  Tell me about your project ideas and goals. I'll guide you through the scoping process.")
+            elif self.current_project.stage == "scoping":
+                print("\nℹ️  Continuing project scoping. Please respond to continue our conversation.")
+                
+        user_input = input(f"\n> ")
+        
+        # Prevent empty inputs
+        while not user_input.strip():
+            print("Empty input. Please type something or use a command.")
+            user_input = input(f"\n> ")
+        return user_input
+    
+    def _handle_command(self, user_input: str) -> Optional[str]:
+        """
+        Handle a special command.
+        
+        Returns:
+            The command name ("help", "exit", "save" or "history"), or None
+            if the input is a regular message
+        """
+        # One dict lookup tells commands apart from the regular messages
+        command = _COMMANDS.get(user_input.lower())
+        if command is None:
+            return None
+        
+        if command == "help":
+            print("\nAvailable commands:")
+            print("  - 'exit' or 'quit': End the session")
+            print("  - 'save progress': Save current progress")
+            print("  - 'history': Show conversation history")
+            print("  - 'help': Show this help message")
+        elif command == "exit":
+            print("\n--- Project Scoping Conversation Ended ---")
+        elif command == "save":
+            print("\n[System] Progress saved. You can continue this session later by selecting this project.")
+        elif command == "history":
+            if self.current_project and self.current_project.interaction_history:
+                print("\n--- Interaction History ---")
+                print(self.current_project.interaction_history.get_summary())
+            else:
+                print("\nNo interaction history available.")
+        
+        return command
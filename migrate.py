@@ -4,117 +4,161 @@ Migration tool to convert existing project JSON files to the new enhanced format
 """
 
 import os
-import json
 import glob
 import shutil
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
+
+from utils import serialization
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+# Path of the interaction list inside a project file, in ijson prefix notation
+INTERACTIONS_PREFIX = "interaction_history.interactions.item"
+# Chunk size used when copying a project file's original contents
+COPY_CHUNK_SIZE = 1024 * 1024
+# Project files handed to each migration worker at a time
+MIGRATION_CHUNK_SIZE = 8
+# Categories a scope needs before it is complete, in the order they are reported
+REQUIRED_CATEGORIES: Tuple[str, ...] = (
+    "project_name", "objective", "audience", "deliverable",
+    "timeline", "resource", "risk", "success_metric"
+)
 
 def backup_projects_directory(projects_dir: str) -> str:
     """Create a backup of the projects directory."""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     backup_dir = f"{projects_dir}_backup_{timestamp}"
     
-    # Create backup by copying the directory
-    shutil.copytree(projects_dir, backup_dir)
+    # Project files are hard-linked: migration replaces them with new files
+    # rather than rewriting them, so the links keep the originals. Everything
+    # else is copied, since interaction logs are appended to in place
+    linkable = {os.path.normpath(path) for path in _project_files(projects_dir)}
+    
+    def link_or_copy(src: str, dst: str) -> str:
+        """Hard-link a project file into the backup, or copy any other file."""
+        if os.path.normpath(src) in linkable:
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                pass  # Links unsupported here, e.g. across devices
+        return shutil.copy2(src, dst)
+    
+    shutil.copytree(projects_dir, backup_dir, copy_function=link_or_copy)
     print(f"Backup created at: {backup_dir}")
     
     return backup_dir
 
+def _project_files(projects_dir: str) -> List[str]:
+    """Get the project files that migration replaces."""
+    return glob.glob(os.path.join(projects_dir, "*.json"))
+
+def build_enhanced_scope(interactions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the enhanced scope structure from a project's interaction history."""
+    # Create enhanced scope structure
+    enhanced_scope = {
+        "metadata": {
+            "last_updated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "completion_percentage": 0,
+            "completion_status": {},
+            "version": 1
+        },
+        "categories": {}
+    }
+    
+    # Migrate interaction history to enhanced scope
+    for interaction in interactions:
+        category = interaction.get("category")
+        
+        if not category:
+            continue
+        
+        # Initialize category data
+        if category not in enhanced_scope["categories"]:
+            enhanced_scope["categories"][category] = {
+                "value": None,
+                "description": None,
+                "timestamp": interaction.get("timestamp"),
+                "raw_input": None,
+                "selected_suggestion": None
+            }
+        
+        # Update with interaction data
+        category_data = enhanced_scope["categories"][category]
+        
+        if interaction.get("is_custom") and interaction.get("custom_input"):
+            category_data["value"] = interaction["custom_input"]
+            category_data["raw_input"] = interaction["custom_input"]
+        elif interaction.get("selection"):
+            category_data["value"] = interaction["selection"]
+            category_data["selected_suggestion"] = {
+                "id": interaction.get("selection_id", ""),
+                "text": interaction["selection"]
+            }
+            
+            # Look for additional data in the selected suggestion; each id is
+            # only looked up once, so a scan beats building an index
+            selection_id = interaction.get("selection_id")
+            selected = next(
+                (suggestion for suggestion in interaction.get("suggestions", [])
+                 if suggestion.get("id") == selection_id),
+                None
+            )
+            if selected and selected.get("description"):
+                category_data["description"] = selected["description"]
+        
+        # Update timestamp if newer
+        if interaction.get("timestamp"):
+            if not category_data["timestamp"] or interaction["timestamp"] > category_data["timestamp"]:
+                category_data["timestamp"] = interaction["timestamp"]
+    
+    # Calculate completion status - everything starts incomplete, and a
+    # single pass over the categories marks the ones that have a value
+    completion_status = dict.fromkeys(REQUIRED_CATEGORIES, "incomplete")
+    completed_count = 0
+    
+    for category, category_data in enhanced_scope["categories"].items():
+        if category in completion_status and category_data["value"]:
+            completion_status[category] = "completed"
+            completed_count += 1
+    
+    # Update completion percentage
+    completion_percentage = (completed_count / len(REQUIRED_CATEGORIES)) * 100
+    enhanced_scope["metadata"]["completion_percentage"] = round(completion_percentage, 2)
+    
+    enhanced_scope["metadata"]["completion_status"] = completion_status
+    
+    return enhanced_scope
+
 def migrate_project_file(file_path: str) -> bool:
     """Migrate a single project file to the new format."""
     try:
-        with open(file_path, 'r') as f:
-            project_data = json.load(f)
+        if ijson is not None:
+            return _migrate_project_file_streaming(file_path)
+        
+        with open(file_path, 'rb') as f:
+            project_data = serialization.loads(f.read())
         
         # Check if already migrated
         if "enhanced_scope" in project_data:
             print(f"Project already migrated: {file_path}")
             return True
         
-        # Create enhanced scope structure
-        enhanced_scope = {
-            "metadata": {
-                "last_updated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                "completion_percentage": 0,
-                "completion_status": {},
-                "version": 1
-            },
-            "categories": {}
-        }
-        
-        # Migrate interaction history to enhanced scope
-        if "interaction_history" in project_data and "interactions" in project_data["interaction_history"]:
-            for interaction in project_data["interaction_history"]["interactions"]:
-                category = interaction.get("category")
-                
-                if not category:
-                    continue
-                
-                # Initialize category data
-                if category not in enhanced_scope["categories"]:
-                    enhanced_scope["categories"][category] = {
-                        "value": None,
-                        "description": None,
-                        "timestamp": interaction.get("timestamp"),
-                        "raw_input": None,
-                        "selected_suggestion": None
-                    }
-                
-                # Update with interaction data
-                category_data = enhanced_scope["categories"][category]
-                
-                if interaction.get("is_custom") and interaction.get("custom_input"):
-                    category_data["value"] = interaction["custom_input"]
-                    category_data["raw_input"] = interaction["custom_input"]
-                elif interaction.get("selection"):
-                    category_data["value"] = interaction["selection"]
-                    category_data["selected_suggestion"] = {
-                        "id": interaction.get("selection_id", ""),
-                        "text": interaction["selection"]
-                    }
-                    
-                    # Look for additional data in suggestions
-                    for suggestion in interaction.get("suggestions", []):
-                        if suggestion.get("id") == interaction.get("selection_id"):
-                            if suggestion.get("description"):
-                                category_data["description"] = suggestion["description"]
-                            break
-                
-                # Update timestamp if newer
-                if interaction.get("timestamp"):
-                    if not category_data["timestamp"] or interaction["timestamp"] > category_data["timestamp"]:
-                        category_data["timestamp"] = interaction["timestamp"]
-        
-        # Calculate completion status
-        required_categories = [
-            "project_name", "objective", "audience", "deliverable", 
-            "timeline", "resource", "risk", "success_metric"
-        ]
-        
-        completion_status = {}
-        completed_count = 0
-        
-        for category in required_categories:
-            if category in enhanced_scope["categories"] and enhanced_scope["categories"][category]["value"]:
-                completion_status[category] = "completed"
-                completed_count += 1
-            else:
-                completion_status[category] = "incomplete"
-        
-        # Update completion percentage
-        if required_categories:
-            completion_percentage = (completed_count / len(required_categories)) * 100
-            enhanced_scope["metadata"]["completion_percentage"] = round(completion_percentage, 2)
-        
-        enhanced_scope["metadata"]["completion_status"] = completion_status
+        interactions = project_data.get("interaction_history", {}).get("interactions", [])
         
         # Add enhanced scope to project data
-        project_data["enhanced_scope"] = enhanced_scope
+        project_data["enhanced_scope"] = build_enhanced_scope(interactions)
         
         # Save updated project file
-        with open(file_path, 'w') as f:
-            json.dump(project_data, f, indent=2)
+        data = serialization.dumps(project_data, indent=True)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
         
         print(f"Successfully migrated: {file_path}")
         return True
@@ -123,13 +167,97 @@ def migrate_project_file(file_path: str) -> bool:
         print(f"Error migrating {file_path}: {e}")
         return False
 
+def _migrate_project_file_streaming(file_path: str) -> bool:
+    """
+    Migrate a project file without loading the whole document.
+    
+    The interactions are parsed one at a time with ijson, and the enhanced
+    scope is spliced in before the document's closing brace, so peak memory
+    is bounded by a single interaction rather than the file size.
+    """
+    # First pass: the top-level keys, without building any values
+    with open(file_path, 'rb') as f:
+        top_level_keys = [
+            value for prefix, event, value in ijson.parse(f)
+            if prefix == "" and event == "map_key"
+        ]
+    
+    # Check if already migrated
+    if "enhanced_scope" in top_level_keys:
+        print(f"Project already migrated: {file_path}")
+        return True
+    
+    # Second pass: fold the interactions into the enhanced scope as they stream in
+    with open(file_path, 'rb') as f:
+        enhanced_scope = build_enhanced_scope(
+            ijson.items(f, INTERACTIONS_PREFIX, use_float=True)
+        )
+    
+    # Nested one level deeper than the top-level object
+    scope_json = serialization.dumps(enhanced_scope, indent=True).replace(b"\n", b"\n  ")
+    
+    temp_path = f"{file_path}.tmp"
+    try:
+        with open(file_path, 'rb') as src, open(temp_path, 'wb') as dst:
+            # Copy everything up to the closing brace of the top-level object
+            remaining = _find_object_end(src)
+            while remaining:
+                chunk = src.read(min(COPY_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise ValueError("Unexpected end of file")
+                dst.write(chunk)
+                remaining -= len(chunk)
+            
+            dst.write(b",\n" if top_level_keys else b"\n")
+            dst.write(b'  "enhanced_scope": ' + scope_json + b"\n}\n")
+        
+        # Replace rather than rewrite, so the original inode is left untouched
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    
+    print(f"Successfully migrated: {file_path}")
+    return True
+
+def _find_object_end(f) -> int:
+    """
+    Find where the top-level object's members end in a binary JSON file.
+    
+    Returns:
+        The offset just past the last member, ignoring the whitespace
+        before the closing brace; the file is left at its start
+    """
+    f.seek(0, os.SEEK_END)
+    position = f.tell()
+    while position > 0:
+        step = min(COPY_CHUNK_SIZE, position)
+        position -= step
+        f.seek(position)
+        chunk = f.read(step)
+        index = chunk.rfind(b"}")
+        if index == -1:
+            continue
+        
+        # Step back over the whitespace before the brace
+        end = position + len(chunk[:index].rstrip())
+        while end > 0 and end == position:
+            step = min(COPY_CHUNK_SIZE, position)
+            position -= step
+            f.seek(position)
+            end = position + len(f.read(step).rstrip())
+        f.seek(0)
+        return end
+    raise ValueError("Project file is not a JSON object")
+
 def migrate_all_projects(projects_dir: str) -> None:
     """Migrate all project files in the directory."""
     # Create backup
     backup_projects_directory(projects_dir)
     
     # Get all project files
-    project_files = glob.glob(os.path.join(projects_dir, "*.json"))
+    project_files = _project_files(projects_dir)
     
     if not project_files:
         print(f"No project files found in {projects_dir}")
@@ -137,11 +265,18 @@ def migrate_all_projects(projects_dir: str) -> None:
     
     print(f"Found {len(project_files)} project files to migrate")
     
-    # Migrate each file
-    success_count = 0
-    for file_path in project_files:
-        if migrate_project_file(file_path):
-            success_count += 1
+    # Migrate each file - files are independent, so spread them across cores
+    if len(project_files) == 1:
+        results = [migrate_project_file(project_files[0])]
+    else:
+        # Imported here - it pulls in multiprocessing, which a single file never needs
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(
+                migrate_project_file, project_files, chunksize=MIGRATION_CHUNK_SIZE
+            ))
+    success_count = sum(results)
     
     print(f"\nMigration complete: {success_count} of {len(project_files)} files successfully migrated")
 
@@ -1,7 +1,8 @@
 # models/interaction.py
+import sys
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import List, Optional, Dict, Any, Set, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 from models.suggestions import SuggestionItem
 
@@ -11,7 +12,7 @@ class InteractionRecord(BaseModel):
     question: str
     category: Optional[str] = None
     context: Optional[str] = None  # Provides additional context about this question
-    suggestions: List[SuggestionItem] = Field(default_factory=list)
+    suggestions: Tuple[SuggestionItem, ...] = ()  # Immutable, like its items
     selection: Optional[str] = None  # The text of the selected suggestion
     selection_id: Optional[str] = None  # The ID of the selected suggestion
     custom_input: Optional[str] = None  # Custom input if not selecting from suggestions
@@ -23,15 +24,29 @@ class InteractionRecord(BaseModel):
         if not v or v == "." or not v.strip():
             return "No specific question recorded"
         return v
+    
+    @validator('category')
+    def intern_category(cls, v):
+        """Share one string object per category across all interactions."""
+        return sys.intern(v) if v else v
 
 class InteractionHistory(BaseModel):
     """Enhanced model for storing interaction history with better querying capabilities."""
     interactions: List[InteractionRecord] = Field(default_factory=list)
     
+    # Indices added or changed since the interaction log was last written
+    _dirty_indices: Set[int] = PrivateAttr(default_factory=set)
+    # Interaction log file this history is currently in sync with
+    _log_path: Optional[str] = PrivateAttr(default=None)
+    # Number of lines in that log, superseded ones included
+    _log_lines: int = PrivateAttr(default=0)
+    
     def add_interaction(self, interaction: InteractionRecord) -> int:
         """Add an interaction and return its index."""
         self.interactions.append(interaction)
-        return len(self.interactions) - 1
+        index = len(self.interactions) - 1
+        self._dirty_indices.add(index)
+        return index
     
     def update_interaction(self, index: int, **updates) -> bool:
         """Update an interaction at the given index."""
@@ -39,26 +54,37 @@ class InteractionHistory(BaseModel):
             interaction = self.interactions[index]
             for key, value in updates.items():
                 setattr(interaction, key, value)
+            self._dirty_indices.add(index)
             return True
         return False
     
+    def has_unsaved_changes(self) -> bool:
+        """Check whether any interaction changed since the log was last written."""
+        return bool(self._dirty_indices)
+    
+    def pop_dirty_indices(self) -> List[int]:
+        """Return the indices changed since the last call, in order, and reset them."""
+        # Swapped before sorting, so an index added meanwhile isn't cleared unseen
+        dirty, self._dirty_indices = self._dirty_indices, set()
+        return sorted(dirty)
+    
     def get_summary(self) -> str:
         """Get a human-readable summary of the interaction history."""
-        summary = "Interaction History:\n\n"
+        parts = ["Interaction History:\n\n"]
         for i, interaction in enumerate(self.interactions, 1):
-            summary += f"Interaction {i}:\n"
-            summary += f"  Question: {interaction.question}\n"
+            parts.append(f"Interaction {i}:\n")
+            parts.append(f"  Question: {interaction.question}\n")
             
             if interaction.category:
-                summary += f"  Category: {interaction.category}\n"
+                parts.append(f"  Category: {interaction.category}\n")
                 
             if interaction.is_custom:
-                summary += f"  Custom Response: {interaction.custom_input}\n"
+                parts.append(f"  Custom Response: {interaction.custom_input}\n")
             else:
-                summary += f"  Selected: {interaction.selection}\n"
+                parts.append(f"  Selected: {interaction.selection}\n")
             
-            summary += f"  Timestamp: {interaction.timestamp}\n\n"
-        return summary
+            parts.append(f"  Timestamp: {interaction.timestamp}\n\n")
+        return "".join(parts)
     
     def get_interactions_by_category(self, category: str) -> List[InteractionRecord]:
         """Get all interactions for a specific category."""
@@ -66,8 +92,10 @@ class InteractionHistory(BaseModel):
         
     def get_latest_by_category(self, category: str) -> Optional[InteractionRecord]:
         """Get the most recent interaction for a specific category."""
-        matching = self.get_interactions_by_category(category)
-        if matching:
-            # Sort by timestamp descending
-            return sorted(matching, key=lambda x: x.timestamp, reverse=True)[0]
-        return None
\ No newline at end of file
+        # Single pass - the first interaction with the newest timestamp wins,
+        # as it did when the matches were sorted
+        return max(
+            (i for i in self.interactions if i.category == category),
+            key=lambda x: x.timestamp,
+            default=None
+        )
\ No newline at end of file
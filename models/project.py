@@ -1,11 +1,18 @@
 # models/project.py
+import uuid
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union, Literal, TYPE_CHECKING
-from pydantic import BaseModel, Field, validator
+from typing import List, Dict, Any, Optional, Set, Union, Literal, TYPE_CHECKING
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, validator
 
 if TYPE_CHECKING:
     from models.interaction import InteractionHistory
 
+# Categories that count towards a project's completion percentage
+REQUIRED_CATEGORIES = (
+    "project_name", "objective", "audience", "deliverable",
+    "timeline", "resource", "risk", "success_metric"
+)
+
 class ScopeMetadata(BaseModel):
     """Model for scope metadata."""
     last_updated: str = Field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
@@ -28,6 +35,7 @@ class ScopeData(BaseModel):
 
 class ProjectData(BaseModel):
     """Enhanced model for project data with better scope tracking."""
+    uid: str = Field(default_factory=lambda: str(uuid.uuid4()))  # Stable across renames
     name: str
     created_at: str = Field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
     last_modified: str = Field(default_factory=lambda: datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
@@ -40,13 +48,15 @@ class ProjectData(BaseModel):
     description: Optional[str] = None
     interaction_history: Optional["InteractionHistory"] = None
     
+    # Fields changed since the last save, so unchanged ones needn't be re-dumped
+    _dirty_fields: Set[str] = PrivateAttr(default_factory=set)
+    
     class Config:
         validate_assignment = True
         
     def __init__(self, **data):
         """Initialize project data with an empty interaction history if none provided."""
         if "interaction_history" not in data:
-            from models.interaction import InteractionHistory
             data["interaction_history"] = InteractionHistory()
         
         # Initialize enhanced scope if not present
@@ -55,16 +65,50 @@ class ProjectData(BaseModel):
             
         super().__init__(**data)
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, remembering which model fields have changed."""
+        if name not in type(self).model_fields:
+            super().__setattr__(name, value)
+            return
+        
+        # Re-assigning an equal value (e.g. the same thread ID) isn't a change
+        changed = getattr(self, name) != value
+        super().__setattr__(name, value)
+        if changed:
+            self._dirty_fields.add(name)
+    
+    def mark_dirty(self, *fields: str) -> None:
+        """Mark fields as changed after mutating them in place."""
+        self._dirty_fields.update(fields)
+    
+    def has_unsaved_changes(self) -> bool:
+        """Check whether any field or interaction changed since the last save."""
+        if self._dirty_fields:
+            return True
+        return self.interaction_history is not None and self.interaction_history.has_unsaved_changes()
+    
+    def pop_dirty_fields(self) -> Set[str]:
+        """Return the fields changed since the last call and reset tracking."""
+        dirty = self._dirty_fields
+        self._dirty_fields = set()
+        return dirty
+    
     def update_last_modified(self) -> None:
         """Update the last modified timestamp."""
         self.last_modified = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     def get_completion_percentage(self) -> float:
-        """Get the project completion percentage."""
+        """Get the project completion percentage, as last computed by _update_completion_status."""
         if self.enhanced_scope and self.enhanced_scope.metadata:
             return self.enhanced_scope.metadata.completion_percentage
         return 0
     
+    @computed_field
+    @property
+    def completion_percentage(self) -> float:
+        """Completion percentage, saved with the project so listings can skip validation."""
+        return float(self.get_completion_percentage())
+    
     def update_category_from_interaction(self, category: str, interaction_data: dict) -> None:
         """Update a scope category from interaction data."""
         if not self.enhanced_scope:
@@ -91,29 +135,28 @@ class ProjectData(BaseModel):
             
         # Update completion status
         self._update_completion_status()
+        self.mark_dirty("enhanced_scope")
     
     def _update_completion_status(self) -> None:
         """Update the completion status based on category values."""
         if not self.enhanced_scope:
             return
             
+        categories = self.enhanced_scope.categories
         completion_status = {}
-        required_categories = [
-            "project_name", "objective", "audience", "deliverable", 
-            "timeline", "resource", "risk", "success_metric"
-        ]
+        completed = 0
         
-        # Check each required category
-        for category in required_categories:
-            if category in self.enhanced_scope.categories and self.enhanced_scope.categories[category].value:
+        # Check each required category, counting completions as we go
+        for category in REQUIRED_CATEGORIES:
+            category_data = categories.get(category)
+            if category_data is not None and category_data.value:
                 completion_status[category] = "completed"
+                completed += 1
             else:
                 completion_status[category] = "incomplete"
         
         # Calculate percentage
-        completed = sum(1 for status in completion_status.values() if status == "completed")
-        total = len(required_categories)
-        completion_percentage = (completed / total) * 100 if total > 0 else 0
+        completion_percentage = (completed / len(REQUIRED_CATEGORIES)) * 100
         
         # Update metadata
         self.enhanced_scope.metadata.completion_status = completion_status
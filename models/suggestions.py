@@ -1,10 +1,14 @@
 # models/suggestions.py
 import uuid
 from typing import List, Dict, Any, Optional, Union, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class SuggestionItem(BaseModel):
     """Model for a single suggestion item."""
+    # Immutable, so the same items can be shared by the tool coordinator,
+    # interaction records and the UI without defensive copies
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     text: str
     description: Optional[str] = None
@@ -8,6 +8,9 @@ setup(
         "openai>=1.0.0",
         "pydantic>=2.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0", "ijson>=3.1"],
+    },
     entry_points={
         "console_scripts": [
             "scope-agent=main:main",
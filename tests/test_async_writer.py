@@ -0,0 +1,72 @@
+# tests/test_async_writer.py
+import threading
+
+from managers.async_writer import AsyncProjectWriter
+
+class _Recorder:
+    """Write function that counts its calls and fails while told to."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.written = threading.Event()
+    
+    def __call__(self) -> bool:
+        self.calls += 1
+        self.written.set()
+        return not self.fail
+
+def test_flush_coalesces_scheduled_saves():
+    """Any number of scheduled saves cost one write when flushed."""
+    write = _Recorder()
+    writer = AsyncProjectWriter(write, debounce_seconds=60)
+    for _ in range(5):
+        writer.schedule()
+    
+    assert writer.flush()
+    assert write.calls == 1
+    assert not writer.pending
+    
+    # Nothing pending - nothing written
+    assert writer.flush()
+    assert write.calls == 1
+    writer.close()
+
+def test_background_write_after_debounce():
+    """A scheduled save is written by the writer thread once changes stop."""
+    write = _Recorder()
+    writer = AsyncProjectWriter(write, debounce_seconds=0.01)
+    writer.schedule()
+    
+    assert write.written.wait(5)
+    writer.close()
+    assert write.calls == 1
+
+def test_failed_write_stays_pending():
+    """A failed write is reported and left pending for the next flush."""
+    write = _Recorder()
+    write.fail = True
+    writer = AsyncProjectWriter(write, debounce_seconds=60)
+    writer.schedule()
+    
+    assert not writer.flush()
+    assert writer.pending
+    
+    write.fail = False
+    assert writer.flush()
+    assert not writer.pending
+    assert write.calls == 2
+    writer.close()
+
+def test_close_writes_pending_and_later_saves_synchronously():
+    """close() writes what is pending; saves scheduled after it are written at once."""
+    write = _Recorder()
+    writer = AsyncProjectWriter(write, debounce_seconds=60)
+    writer.schedule()
+    
+    assert writer.close()
+    assert write.calls == 1
+    
+    writer.schedule()
+    assert write.calls == 2
+    assert not writer.pending
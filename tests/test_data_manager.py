@@ -0,0 +1,126 @@
+# tests/test_data_manager.py
+import os
+
+from managers.data_manager import DataManager, _LOG_COMPACT_RATIO
+from models.interaction import InteractionHistory, InteractionRecord
+from models.project import ProjectData
+
+def _saved_project(data_manager: DataManager) -> str:
+    """Save a project with two interactions and return its file path."""
+    project = ProjectData(name="Torn Log", interaction_history=InteractionHistory())
+    project.interaction_history.add_interaction(InteractionRecord(question="First?"))
+    project.interaction_history.add_interaction(InteractionRecord(question="Second?"))
+    return data_manager.save_project(project)
+
+def test_load_project_skips_partial_last_log_line(tmp_path):
+    """A crash mid-append leaves a partial line that must not reject the project."""
+    data_manager = DataManager(projects_dir=str(tmp_path))
+    file_path = _saved_project(data_manager)
+    log_path = data_manager._history_log_path(file_path)
+    with open(log_path, 'ab') as f:
+        f.write(b'{"index":1,"record":{"quest')
+    
+    project = data_manager.load_project(file_path)
+    
+    assert project is not None
+    assert [i.question for i in project.interaction_history.interactions] == ["First?", "Second?"]
+    
+    # The next save rewrites the log without the partial line
+    project.interaction_history.add_interaction(InteractionRecord(question="Third?"))
+    data_manager.save_project(project)
+    with open(log_path, 'rb') as f:
+        assert f.read().endswith(b'\n')
+    reloaded = DataManager(projects_dir=str(tmp_path)).load_project(file_path)
+    assert [i.question for i in reloaded.interaction_history.interactions] == ["First?", "Second?", "Third?"]
+
+def test_load_project_rejects_corrupt_log_line(tmp_path):
+    """Only an unterminated last line is tolerated; complete bad lines are errors."""
+    data_manager = DataManager(projects_dir=str(tmp_path))
+    file_path = _saved_project(data_manager)
+    with open(data_manager._history_log_path(file_path), 'ab') as f:
+        f.write(b'not json\n')
+    
+    assert data_manager.load_project(file_path) is None
+
+def test_export_scope_document_reads_scope_dict(tmp_path):
+    """The scope is stored as a plain dict, as saved by the save_scope tool."""
+    data_manager = DataManager(projects_dir=str(tmp_path))
+    project = ProjectData(name="Exported", scope={
+        "objective": {"value": "Ship the CLI", "description": "First release"},
+        "timeline": {"value": "  "},
+        "risk": "Scope creep",
+        "additional_categories": {"budget_notes": {"value": "Small"}}
+    })
+    
+    document = data_manager.export_scope_document(project)
+    
+    assert "## Project Objectives\n\nShip the CLI\n\n*First release*\n\n" in document
+    assert "## Risks\n\nScope creep\n\n" in document
+    assert "## Budget Notes\n\nSmall\n\n" in document
+    assert "## Timeline" not in document
+    assert "## Target Audience" not in document
+
+def test_load_projects_list_sees_in_place_edits(tmp_path):
+    """Editing a project file in place leaves the directory mtime unchanged."""
+    data_manager = DataManager(projects_dir=str(tmp_path))
+    file_path = data_manager.save_project(ProjectData(name="Before"))
+    # The second listing is served after the index write has settled
+    for _ in range(2):
+        assert [p['name'] for p in data_manager.load_projects_list()] == ["Before"]
+    
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    with open(file_path, 'wb') as f:
+        f.write(content.replace(b'"Before"', b'"After Edit"'))
+    
+    assert [p['name'] for p in data_manager.load_projects_list()] == ["After Edit"]
+
+def test_save_load_round_trip_after_rename(tmp_path):
+    """A renamed project is loaded in full from its new files, and the old ones are gone."""
+    data_manager = DataManager(projects_dir=str(tmp_path))
+    old_path = _saved_project(data_manager)
+    project = data_manager.load_project(old_path)
+    
+    assert data_manager.rename_project("Torn Log", "Mended Log", project)
+    project.interaction_history.update_interaction(0, selection="Yes")
+    new_path = data_manager.save_project(project)
+    
+    assert sorted(name for name in os.listdir(tmp_path) if not name.startswith(".")) == [
+        "Mended_Log.json", "Mended_Log.jsonl"
+    ]
+    reloaded = DataManager(projects_dir=str(tmp_path)).load_project(new_path)
+    assert reloaded.name == "Mended Log"
+    assert reloaded.uid == project.uid
+    assert [i.question for i in reloaded.interaction_history.interactions] == ["First?", "Second?"]
+    assert reloaded.interaction_history.interactions[0].selection == "Yes"
+
+def test_history_log_compacts_superseded_lines(tmp_path):
+    """Repeated updates to one interaction don't grow the log without bound."""
+    data_manager = DataManager(projects_dir=str(tmp_path))
+    file_path = _saved_project(data_manager)
+    project = data_manager.load_project(file_path)
+    log_path = data_manager._history_log_path(file_path)
+    
+    for attempt in range(10):
+        project.interaction_history.update_interaction(1, selection=f"Answer {attempt}")
+        data_manager.save_project(project)
+        with open(log_path, 'rb') as f:
+            assert len(f.readlines()) <= _LOG_COMPACT_RATIO * 2
+    
+    reloaded = DataManager(projects_dir=str(tmp_path)).load_project(file_path)
+    assert reloaded.interaction_history.interactions[1].selection == "Answer 9"
+
+def test_partial_save_merges_changed_fields(tmp_path):
+    """Saving after one field changes keeps the rest of the file intact."""
+    data_manager = DataManager(projects_dir=str(tmp_path))
+    project = ProjectData(name="Partial", description="Original", stage="scoping")
+    file_path = data_manager.save_project(project)
+    
+    project.description = "Changed"
+    assert project.has_unsaved_changes()
+    data_manager.save_project(project)
+    
+    assert not project.has_unsaved_changes()
+    assert not os.path.exists(file_path + ".tmp")
+    reloaded = DataManager(projects_dir=str(tmp_path)).load_project(file_path)
+    assert (reloaded.name, reloaded.description, reloaded.stage) == ("Partial", "Changed", "scoping")
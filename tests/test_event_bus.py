@@ -0,0 +1,39 @@
+# tests/test_event_bus.py
+import gc
+
+from utils.event_bus import EventBus
+
+class _Listener:
+    """Object whose bound method is registered on the bus."""
+    
+    def __init__(self, received):
+        self.received = received
+    
+    def on_event(self, data):
+        self.received.append(data)
+
+def test_bound_handler_does_not_keep_object_alive():
+    """Bound methods are held weakly and dropped once their object is gone."""
+    event_bus = EventBus()
+    received = []
+    listener = _Listener(received)
+    event_bus.register("test_weak_event", listener.on_event)
+    
+    event_bus.publish("test_weak_event", 1)
+    del listener
+    gc.collect()
+    event_bus.publish("test_weak_event", 2)
+    
+    assert received == [1]
+
+def test_publish_async_runs_handlers_in_order():
+    """Queued events reach their handlers in publish order once drained."""
+    event_bus = EventBus()
+    received = []
+    topic = event_bus.register("test_async_event", received.append)
+    
+    for i in range(5):
+        event_bus.publish_async(topic, i)
+    event_bus.drain()
+    
+    assert received == [0, 1, 2, 3, 4]
@@ -0,0 +1,59 @@
+# tests/test_migrate.py
+import pytest
+
+import migrate
+from utils import serialization
+
+pytest.importorskip("ijson")
+
+_INTERACTIONS = [
+    {
+        "question": "What is the objective?",
+        "category": "objective",
+        "timestamp": "2024-01-01 10:00:00",
+        "suggestions": [{"id": "s1", "text": "Ship it", "description": "Release the CLI"}],
+        "selection": "Ship it",
+        "selection_id": "s1"
+    },
+    {
+        "question": "Who is it for?",
+        "category": "audience",
+        "timestamp": "2024-01-01 10:05:00",
+        "custom_input": "Developers",
+        "is_custom": True
+    }
+]
+
+def _without_timestamp(enhanced_scope):
+    """Drop the migration time, which differs between runs."""
+    metadata = dict(enhanced_scope["metadata"], last_updated=None)
+    return dict(enhanced_scope, metadata=metadata)
+
+def test_streaming_migration_matches_in_memory(tmp_path):
+    """The ijson path splices in the same enhanced scope the in-memory path builds."""
+    project = {
+        "name": "Legacy",
+        "score": 1.5,
+        "interaction_history": {"interactions": _INTERACTIONS}
+    }
+    file_path = tmp_path / "Legacy.json"
+    file_path.write_bytes(serialization.dumps(project, indent=True) + b"\n\n")
+    
+    assert migrate._migrate_project_file_streaming(str(file_path))
+    
+    migrated = serialization.loads(file_path.read_bytes())
+    assert {key: migrated[key] for key in project} == project
+    assert _without_timestamp(migrated["enhanced_scope"]) == _without_timestamp(
+        migrate.build_enhanced_scope(_INTERACTIONS)
+    )
+    assert migrated["enhanced_scope"]["categories"]["objective"]["description"] == "Release the CLI"
+    assert not (tmp_path / "Legacy.json.tmp").exists()
+
+def test_streaming_migration_skips_migrated_file(tmp_path):
+    """A file that already has an enhanced scope is left as it is."""
+    file_path = tmp_path / "Done.json"
+    content = serialization.dumps({"name": "Done", "enhanced_scope": {}}, indent=True)
+    file_path.write_bytes(content)
+    
+    assert migrate._migrate_project_file_streaming(str(file_path))
+    assert file_path.read_bytes() == content
@@ -0,0 +1,51 @@
+# tests/test_project_lifecycle_manager.py
+import os
+
+from managers.data_manager import DataManager
+from managers.project_lifecycle_manager import ProjectLifecycleManager
+from models.interaction import InteractionRecord
+
+def test_rename_drops_pending_save_of_old_file(tmp_path):
+    """A save queued under the old name must not recreate the deleted file."""
+    lifecycle = ProjectLifecycleManager(DataManager(projects_dir=str(tmp_path)))
+    project = lifecycle.create_new_project("A renamed project")
+    old_name = project.name
+    project.interaction_history.add_interaction(InteractionRecord(question="Name?"))
+    lifecycle.save_project()
+    
+    assert lifecycle.update_project_metadata("name", "Renamed")
+    assert lifecycle.close()
+    
+    assert sorted(os.listdir(tmp_path)) == ["Renamed.json", "Renamed.jsonl"]
+    assert old_name != "Renamed"
+    reloaded = DataManager(projects_dir=str(tmp_path)).load_project(str(tmp_path / "Renamed.json"))
+    assert reloaded.name == "Renamed"
+    assert [i.question for i in reloaded.interaction_history.interactions] == ["Name?"]
+
+def test_flush_sync_reports_failed_write_until_saved(tmp_path):
+    """A failed write is retried by the next flush rather than reported as saved."""
+    data_manager = DataManager(projects_dir=str(tmp_path))
+    lifecycle = ProjectLifecycleManager(data_manager)
+    project = lifecycle.create_new_project("Flaky disk")
+    
+    atomic_write = data_manager._atomic_write
+    def failing_write(file_path, data):
+        raise OSError("disk full")
+    data_manager._atomic_write = failing_write
+    try:
+        assert not lifecycle.flush_sync()
+        assert not lifecycle._writer.flush()
+    finally:
+        data_manager._atomic_write = atomic_write
+    
+    assert lifecycle.flush_sync()
+    reloaded = DataManager(projects_dir=str(tmp_path)).load_project(data_manager._project_file_path(project))
+    assert reloaded.description == "Flaky disk"
+    lifecycle.close()
+
+def test_flush_sync_without_project(tmp_path):
+    """Flushing before any project is open has nothing to write."""
+    lifecycle = ProjectLifecycleManager(DataManager(projects_dir=str(tmp_path)))
+    
+    assert lifecycle.flush_sync()
+    assert lifecycle.close()
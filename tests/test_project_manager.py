@@ -0,0 +1,48 @@
+# tests/test_project_manager.py
+from types import SimpleNamespace
+
+from managers.data_manager import DataManager
+from managers.project_manager import ProjectManager
+from managers.ui_manager import UIManager
+from utils.events import TOPIC_NEW_PROJECT_REQUESTED
+
+class _FakeBeta:
+    """Stands in for client.beta, handing out fixed assistant and thread IDs."""
+    
+    def __init__(self):
+        self.assistant_tools = None
+        self.assistants = SimpleNamespace(create=self._create_assistant)
+        self.threads = SimpleNamespace(create=lambda: SimpleNamespace(id="thread_1"))
+    
+    def _create_assistant(self, name, instructions, tools, model):
+        self.assistant_tools = tools
+        return SimpleNamespace(id="asst_1")
+
+def test_new_project_sets_up_assistant_and_thread(tmp_path, monkeypatch):
+    """Creating a project builds the conversation components and saves their IDs."""
+    monkeypatch.setattr(ProjectManager, "_install_signal_handling", lambda self: None)
+    api_client = SimpleNamespace(beta=_FakeBeta())
+    project_manager = ProjectManager(
+        api_client=api_client,
+        ui_manager=UIManager(),
+        data_manager=DataManager(projects_dir=str(tmp_path))
+    )
+    started = []
+    # The conversation itself needs the live API, so only its start is recorded
+    project_manager.__dict__["conversation_flow"] = SimpleNamespace(start_conversation=started.append)
+    
+    project_manager.event_bus.publish(TOPIC_NEW_PROJECT_REQUESTED, "A scoped project")
+    
+    project = project_manager.lifecycle_manager.get_current_project()
+    assert started == [project]
+    assert (project.assistant_id, project.thread_id) == ("asst_1", "thread_1")
+    assert project_manager.tool_coordinator.thread_id == "thread_1"
+    assert api_client.beta.assistant_tools == project_manager.tool_coordinator.tool_definitions
+    
+    assert project_manager.lifecycle_manager.close()
+    reloaded = DataManager(projects_dir=str(tmp_path)).load_project(
+        str(tmp_path / f"{project.name}.json")
+    )
+    assert (reloaded.description, reloaded.assistant_id, reloaded.thread_id) == (
+        "A scoped project", "asst_1", "thread_1"
+    )
@@ -1,6 +1,10 @@
 # utils/event_bus.py
+import queue
+import inspect
 import logging
-from typing import Dict, List, Any, Callable
+import weakref
+import threading
+from typing import ClassVar, Dict, List, Any, Callable, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -10,43 +14,167 @@ class EventBus:
     
     This allows for loose coupling between components - publishers don't need
     to know about subscribers and vice versa.
+    
+    Event types are resolved to small integer topic ids when handlers are
+    registered, so publishing is a list index rather than a dict lookup.
+    Bound methods are held through weak references, so registering a
+    handler doesn't keep its object alive.
     """
     
+    # Topic ids shared by every bus, assigned in first-seen order
+    _topic_ids: ClassVar[Dict[str, int]] = {}
+    _topic_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self):
         """Initialize an empty event bus."""
-        self.handlers: Dict[str, List[Callable]] = {}
+        # Handlers per topic id; tuples are replaced rather than mutated so
+        # publish can iterate them without copying or locking
+        self._handlers: List[Tuple[Callable, ...]] = []
+        
+        # Events published with publish_async, run in order by a worker thread
+        self._queue: "queue.Queue[Tuple[Union[str, int], Any]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+    
+    @classmethod
+    def topic_id(cls, event_type: str) -> int:
+        """
+        Get the integer topic id for an event type, assigning one if needed.
+        
+        Args:
+            event_type: The type of event
+            
+        Returns:
+            The topic id
+        """
+        topic = cls._topic_ids.get(event_type)
+        if topic is None:
+            with cls._topic_lock:
+                topic = cls._topic_ids.setdefault(event_type, len(cls._topic_ids))
+        return topic
     
-    def register(self, event_type: str, handler: Callable) -> None:
+    def _handlers_for(self, event_type: Union[str, int]) -> Tuple[Callable, ...]:
+        """
+        Get the handlers registered for an event type or topic id.
+        
+        Args:
+            event_type: The type of event, or its topic id
+            
+        Returns:
+            The registered handlers, possibly empty
+        """
+        if event_type.__class__ is not int:
+            event_type = self._topic_ids.get(event_type, -1)
+        if 0 <= event_type < len(self._handlers):
+            return self._handlers[event_type]
+        return ()
+    
+    def register(self, event_type: str, handler: Callable) -> int:
         """
         Register a handler for an event type.
         
         Args:
             event_type: The type of event to handle
             handler: The function to call when the event occurs
+            
+        Returns:
+            The event type's topic id, which may be passed to publish
         """
-        if event_type not in self.handlers:
-            self.handlers[event_type] = []
+        topic = self.topic_id(event_type)
+        if topic >= len(self._handlers):
+            self._handlers.extend([()] * (topic + 1 - len(self._handlers)))
         
-        self.handlers[event_type].append(handler)
+        entry = weakref.WeakMethod(handler) if inspect.ismethod(handler) else handler
+        self._handlers[topic] = self._handlers[topic] + (entry,)
         logger.debug(f"Registered handler for event: {event_type}")
+        return topic
     
-    def publish(self, event_type: str, data: Any = None) -> None:
+    def publish(self, event_type: Union[str, int], data: Any = None) -> None:
         """
         Publish an event to all registered handlers.
         
         Args:
-            event_type: The type of event being published
+            event_type: The type of event being published, or its topic id
             data: Data associated with the event
         """
-        if event_type not in self.handlers:
+        handlers = self._handlers_for(event_type)
+        if not handlers:
             logger.debug(f"No handlers registered for event: {event_type}")
             return
         
-        for handler in self.handlers[event_type]:
+        has_dead = False
+        for handler in handlers:
+            if handler.__class__ is weakref.WeakMethod:
+                handler = handler()
+                if handler is None:
+                    # The handler's object has been garbage collected
+                    has_dead = True
+                    continue
             try:
                 handler(data)
             except Exception as e:
                 logger.error(f"Error in event handler for {event_type}: {e}")
+        
+        if has_dead:
+            self._prune(event_type)
+    
+    def _prune(self, event_type: Union[str, int]) -> None:
+        """
+        Drop handlers whose objects have been garbage collected.
+        
+        Args:
+            event_type: The type of event, or its topic id
+        """
+        topic = event_type if event_type.__class__ is int else self._topic_ids[event_type]
+        self._handlers[topic] = tuple(
+            entry for entry in self._handlers[topic]
+            if entry.__class__ is not weakref.WeakMethod or entry() is not None
+        )
+    
+    def publish_async(self, event_type: Union[str, int], data: Any = None) -> None:
+        """
+        Queue an event to be published on a background worker thread.
+        
+        Handlers run in publish order but off the caller's thread, so this
+        should only be used for events whose handlers don't need to finish
+        before the caller continues.
+        
+        Args:
+            event_type: The type of event being published, or its topic id
+            data: Data associated with the event
+        """
+        if not self._handlers_for(event_type):
+            logger.debug(f"No handlers registered for event: {event_type}")
+            return
+        
+        self._ensure_worker()
+        self._queue.put((event_type, data))
+    
+    def drain(self) -> None:
+        """Block until every queued event has been handled."""
+        if self._worker is not None:
+            self._queue.join()
+    
+    def _ensure_worker(self) -> None:
+        """Start the worker thread the first time it is needed."""
+        if self._worker is not None:
+            return
+        
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="event-bus", daemon=True
+                )
+                self._worker.start()
+    
+    def _run_worker(self) -> None:
+        """Publish queued events until the process exits."""
+        while True:
+            event_type, data = self._queue.get()
+            try:
+                self.publish(event_type, data)
+            finally:
+                self._queue.task_done()
     
     def unregister(self, event_type: str, handler: Callable) -> bool:
         """
@@ -59,11 +187,16 @@ class EventBus:
         Returns:
             True if the handler was removed, False otherwise
         """
-        if event_type not in self.handlers:
+        topic = self._topic_ids.get(event_type)
+        if topic is None or topic >= len(self._handlers):
             return False
         
-        try:
-            self.handlers[event_type].remove(handler)
-            return True
-        except ValueError:
-            return False
\ No newline at end of file
+        handlers = list(self._handlers[topic])
+        for index, entry in enumerate(handlers):
+            if entry.__class__ is weakref.WeakMethod:
+                entry = entry()
+            if entry == handler:
+                del handlers[index]
+                self._handlers[topic] = tuple(handlers)
+                return True
+        return False
\ No newline at end of file
@@ -0,0 +1,34 @@
+# utils/events.py
+"""Event types published on the EventBus."""
+import sys
+from typing import Final
+
+# Project lifecycle events
+TOPIC_PROJECT_CREATED: Final[str] = sys.intern("project_created")
+TOPIC_PROJECT_LOADED: Final[str] = sys.intern("project_loaded")
+TOPIC_PROJECT_SAVED: Final[str] = sys.intern("project_saved")
+TOPIC_PROJECT_UPDATED: Final[str] = sys.intern("project_updated")
+
+# Project selection events
+TOPIC_NEW_PROJECT_REQUESTED: Final[str] = sys.intern("new_project_requested")
+TOPIC_PROJECT_FILE_SELECTED: Final[str] = sys.intern("project_file_selected")
+TOPIC_PROJECT_NAME_SELECTED: Final[str] = sys.intern("project_name_selected")
+
+# Conversation events
+TOPIC_CONVERSATION_STARTED: Final[str] = sys.intern("conversation_started")
+TOPIC_MESSAGE_SENT: Final[str] = sys.intern("message_sent")
+TOPIC_ASSISTANT_MESSAGE: Final[str] = sys.intern("assistant_message")
+TOPIC_RUN_COMPLETED: Final[str] = sys.intern("run_completed")
+
+# Tool events
+TOPIC_THREAD_CREATED: Final[str] = sys.intern("thread_created")
+TOPIC_SUGGESTIONS_GENERATED: Final[str] = sys.intern("suggestions_generated")
+TOPIC_PROJECT_NAMES_GENERATED: Final[str] = sys.intern("project_names_generated")
+TOPIC_SCOPE_SAVED: Final[str] = sys.intern("scope_saved")
+
+# UI events
+TOPIC_USER_INPUT: Final[str] = sys.intern("user_input")
+TOPIC_EXIT_REQUESTED: Final[str] = sys.intern("exit_requested")
+
+# Current project request
+TOPIC_GET_CURRENT_PROJECT: Final[str] = sys.intern("get_current_project")
@@ -0,0 +1,42 @@
+# utils/serialization.py
+"""JSON helpers that use orjson when it is installed and fall back to pydantic-core and the stdlib."""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text as str or UTF-8 bytes
+        
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: The object to serialize
+        indent: Pretty-print with a two-space indent
+        
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    # pydantic-core's encoder is native even when indenting, unlike the
+    # stdlib's, which drops to pure Python whenever indent is set. Imported
+    # here so scripts that never encode, or have orjson, skip loading it
+    import pydantic_core
+    return pydantic_core.to_json(obj, indent=2 if indent else None)